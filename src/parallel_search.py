@@ -0,0 +1,114 @@
+'''
+Паралельний пошук підрядка: текст ділиться на частини з перекриттям m-1 символів,
+кожна частина обробляється окремим процесом будь-яким алгоритмом з substring_search.ENGINES.
+'''
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from substring_search import ENGINES, as_pattern, check_types, is_bytes_like
+
+
+def partitions(n: int, m: int, parts: int) -> list[tuple[int, int]]:
+    # split window start positions [0, n-m] into parts ranges [start, stop)
+    # part k reads text[start:stop+m-1], so every window is seen exactly once
+    windows = n - m + 1
+    if windows <= 0:
+        return []
+    parts = max(1, min(parts, windows))
+    size, extra = divmod(windows, parts)
+    out = []
+    start = 0
+    for k in range(parts):
+        stop = start + size + (1 if k < extra else 0)
+        out.append((start, stop))
+        start = stop
+    return out
+
+
+def search_part(text, pattern, engine, start, stop, find_all):
+    # positions of windows starting in [start, stop), global offsets
+    limit = stop - start
+    found = []
+    for pos in ENGINES[engine](text, pattern):
+        if pos >= limit:
+            # match starts in overlap, it belongs to the next part
+            break
+        found.append(start + pos)
+        if not find_all:
+            break
+    return found
+
+
+def search_str_part(args):
+    part, pattern, engine, start, stop, find_all = args
+    return search_part(part, pattern, engine, start, stop, find_all)
+
+
+def search_shared_part(args):
+    # attach to shared memory by name, search a zero-copy view of the part
+    name, pattern, engine, start, stop, find_all = args
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf[start:stop+len(pattern)-1]
+        try:
+            return search_part(view, pattern, engine, start, stop, find_all)
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def parallel_search(text, pattern, engine="horspool", workers=None, find_all=False):
+    # first match (int | None) or sorted list of all matches (find_all=True)
+    # str parts are pickled to workers, bytes-like text is copied once
+    # into shared memory and workers read it without pickling
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine: {engine}")
+    if not pattern:
+        raise ValueError("empty pattern is not supported")
+
+    workers = workers or os.cpu_count() or 1
+    n = len(text)
+    m = len(pattern)
+    parts = partitions(n, m, workers)
+    if not parts:
+        return [] if find_all else None
+
+    shm = None
+    try:
+        if is_bytes_like(text):
+            shm = shared_memory.SharedMemory(create=True, size=n)
+            shm.buf[:n] = text
+            jobs = [(shm.name, pattern, engine, start, stop, find_all) for start, stop in parts]
+            worker = search_shared_part
+        else:
+            jobs = [(text[start:stop+m-1], pattern, engine, start, stop, find_all) for start, stop in parts]
+            worker = search_str_part
+
+        with ProcessPoolExecutor(max_workers=len(parts)) as pool:
+            # map keeps order of parts, so merging is deterministic
+            results = list(pool.map(worker, jobs))
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    if find_all:
+        return [pos for found in results for pos in found]
+    for found in results:
+        if found:
+            return found[0]
+    return None
+
+
+if __name__ == "__main__":
+    text = "ABCAABBCAABCBACBACA" * 1000
+    pattern = "CBACA"
+
+    print(f"Searching '{pattern}' in {len(text)} symbols")
+    print(f"first match at {parallel_search(text, pattern, workers=4)}")
+    print(f"{len(parallel_search(text, pattern, workers=4, find_all=True))} matches")
@@ -1,167 +1,1809 @@
+import codecs
+import mmap
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from functools import partial
+from time import perf_counter
+
+try:
+    import numpy as np
+except ImportError: # optional, only for rabin_karp(backend="numpy")
+    np = None
+
+
+#---------------------bytes---------------------------------
+# raw binary input is searched as is: indexing gives byte values (int),
+# no decoding and no copy of text
+BYTES_LIKE = (bytes, bytearray, memoryview, mmap.mmap)
+
+
+def is_bytes_like(s) -> bool:
+    return isinstance(s, BYTES_LIKE)
+
+
+def symbols(text, first=0, n=None):
+    # symbols of text[first:n] in order, byte values for bytes-like text, no copy
+    # indexed, not iterated, for a region (text before it is never read) and
+    # for mmap (it iterates as 1-byte bytes objects)
+    if n is None:
+        n = len(text)
+    if first == 0 and n == len(text) and not isinstance(text, mmap.mmap):
+        return iter(text)
+    return map(text.__getitem__, range(first, n))
+
+
+def check_types(text, pattern):
+    # str pattern never matches bytes text, fail loudly like str.find does
+    if is_bytes_like(text) != is_bytes_like(pattern):
+        raise TypeError(f"can not search {type(pattern).__name__} pattern in {type(text).__name__} text")
+
+
+def as_pattern(pattern):
+    # patterns are short, one copy to immutable bytes is cheap
+    return bytes(pattern) if is_bytes_like(pattern) else pattern
+
+
+def bounds(n, start=None, end=None) -> tuple[int, int]:
+    # str.find style region: None means text edge, negative counts from end;
+    # end is clamped to n, start is not (start > n finds nothing, not even "")
+    if start is None:
+        start = 0
+    elif start < 0:
+        start = max(0, start + n)
+    if end is None:
+        end = n
+    elif end < 0:
+        end = max(0, end + n)
+    else:
+        end = min(end, n)
+    return start, end
+
+
+def map_file(path) -> mmap.mmap:
+    # read only memory map, use as context manager: with map_file(path) as text
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+#---------------------casefold------------------------------
+FOLDED = {} # symbol -> its fold, filled on first use
+ASCII_FOLD = bytes(range(256)).lower() # bytes fold A-Z only, like bytes.lower()
+
+
+def fold_symbol(sym: str) -> str:
+    # one to one case folding, so positions in folded text do not move:
+    # casefold when it gives one symbol ("Ω" -> "ω"), else lower ("ß" stays)
+    folded = FOLDED.get(sym)
+    if folded is None:
+        folded = sym.casefold()
+        if len(folded) != 1:
+            folded = sym.lower()
+            if len(folded) != 1:
+                folded = sym
+        FOLDED[sym] = folded
+    return folded
+
+
+def fold_case(s):
+    # folded copy of a pattern or a short slice of text
+    if is_bytes_like(s):
+        return bytes(s).lower()
+    return "".join(map(fold_symbol, s))
+
+
+class FoldedText:
+    # read only view of text with every symbol folded on access:
+    # engines read it like a str, text itself is never copied
+    # (unlike text.lower()), only slices engines take are folded copies
+    def __init__(self, text):
+        self.text = text
+
+    def __len__(self):
+        return len(self.text)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return fold_case(self.text[i])
+        return fold_symbol(self.text[i])
+
+    def __iter__(self):
+        return map(fold_symbol, self.text)
+
+
+class FoldedBytes(FoldedText):
+    # same view over bytes-like text, indexing gives folded byte values
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return fold_case(self.text[i])
+        return ASCII_FOLD[self.text[i]]
+
+    def __iter__(self):
+        return map(ASCII_FOLD.__getitem__, symbols(self.text))
+
+
+# folded bytes are still searched as bytes
+BYTES_LIKE += (FoldedBytes,)
+
+
+def casefolded(text, pattern):
+    # (folded view of text, folded pattern) for engines called with casefold=True
+    check_types(text, pattern)
+    view = FoldedBytes(text) if is_bytes_like(text) else FoldedText(text)
+    return view, fold_case(pattern)
+
+
+#---------------------stats---------------------------------
+class SearchStats:
+    # optional profiler, pass as stats=... to any engine from ENGINES;
+    # without it engines run loops that have no counters at all
+    # comparisons     - symbol comparisons (rabin_karp: window hash comparisons)
+    # shifts          - moves of pattern along text (kmp: also lps fallbacks)
+    # hash_hits       - windows whose hash equals pattern hash
+    # false_positives - hash hits that failed verification
+    # preprocess_time - seconds spent building tables
+    # scan_time       - seconds spent scanning text (paused while consumer holds a match)
+    def __init__(self):
+        self.comparisons = 0
+        self.shifts = 0
+        self.hash_hits = 0
+        self.false_positives = 0
+        self.preprocess_time = 0.0
+        self.scan_time = 0.0
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value}" for name, value in vars(self).items())
+        return f"SearchStats({fields})"
+
+
+def timed(stats, build, *args):
+    # build table, record build time when profiling
+    if stats is None:
+        return build(*args)
+    started = perf_counter()
+    table = build(*args)
+    stats.preprocess_time += perf_counter() - started
+    return table
+
+
+#---------------------cache---------------------------------
+def table_bytes(obj) -> int:
+    # rough size of a compiled table: containers, their items and
+    # attributes of compiled objects; shared small ints are not counted
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        items = obj.values()
+    elif isinstance(obj, (list, tuple)):
+        items = obj
+    elif hasattr(obj, "__dict__"):
+        items = vars(obj).values()
+        size += sys.getsizeof(vars(obj))
+    else:
+        return size
+    return size + sum(table_bytes(x) for x in items if not isinstance(x, (int, float)) and x is not None)
+
+
+class PatternCache:
+    # LRU of compiled pattern tables shared by all engines:
+    # key is (build function, pattern, build args), tables are never
+    # mutated by engines, so one entry can serve any number of searches
+    # evicts least recently used entries while there are more than
+    # max_entries or their estimated size exceeds max_bytes;
+    # max_entries=0 or max_bytes=0 disables caching
+    def __init__(self, max_entries=512, max_bytes=32 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict() # key -> (table, estimated bytes)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, build, pattern, *args):
+        if not self.enabled:
+            return build(pattern, *args)
+        key = (build, pattern, args)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        table = build(pattern, *args)
+        size = table_bytes(table)
+        if size <= self.max_bytes:
+            with self.lock:
+                if key not in self.entries:
+                    self.entries[key] = (table, size)
+                    self.bytes += size
+                    self._evict()
+        return table
+
+    def _evict(self):
+        while self.entries and (len(self.entries) > self.max_entries or self.bytes > self.max_bytes):
+            _, (_, size) = self.entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def resize(self, max_entries=None, max_bytes=None):
+        # new limits apply immediately, 0 disables and empties the cache
+        with self.lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        # drop entries and reset statistics
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return (f"PatternCache(entries={len(self.entries)}/{self.max_entries}, "
+                f"bytes={self.bytes}/{self.max_bytes}, hits={self.hits}, "
+                f"misses={self.misses}, evictions={self.evictions})")
+
+
+PATTERN_CACHE = PatternCache()
+
+
+def compiled(build, pattern, *args):
+    # table for pattern from the shared cache, built on first use
+    return PATTERN_CACHE.get(build, as_pattern(pattern), *args)
+
+
 #-------------------boyer_moore-----------------------------
-def boyer_moore(text: str, pattern: str, use_good_suffix=False) -> tuple[int | None, int, int]:
-    def build_bad_char_table(pattern: str) -> dict[str, int]:
-        bad_char = {}
+# dense bad char table covers code points U+0000-U+04FF (latin, greek, cyrillic)
+DENSE_LIMIT = 0x500
+
+
+def build_bad_char_table(pattern: str, dense=None) -> dict[str, int] | list[int]:
+    # dense=None: list indexed by byte value / code point when whole pattern fits,
+    # dict for sparse unicode; True / False forces the choice
+    raw = is_bytes_like(pattern)
+    if dense is None:
+        dense = raw or all(ord(sym) < DENSE_LIMIT for sym in pattern)
+    if dense:
+        size = 256 if raw else max([DENSE_LIMIT, *(ord(sym) + 1 for sym in pattern)])
+        bad_char = [-1] * size
         for idx, sym in enumerate(pattern):
             # store most right index
-            bad_char[sym] = idx
-
+            bad_char[sym if raw else ord(sym)] = idx
         return bad_char
-        
-    def build_good_suffix_table(pattern: str) -> list[int]:
-        # scanning pattern from right to left
-        # searching leftmost suffix and calculate shift
+
+    bad_char = {}
+    for idx, sym in enumerate(pattern):
+        # store most right index
+        bad_char[sym] = idx
+
+    return bad_char
+
+
+def build_suffixes(pattern: str) -> list[int]:
+    # suff[i] = length of the longest substring ending at i
+    # that is also a suffix of the whole pattern
+    m = len(pattern)
+    suff = [0] * m
+    suff[m-1] = m
+    # [g+1, f] is the rightmost window already known to match a suffix
+    g = m - 1
+    f = m - 1
+    for i in range(m-2, -1, -1):
+        if i > g and suff[i+m-1-f] < i - g:
+            # inside known window: reuse value computed for mirrored position
+            suff[i] = suff[i+m-1-f]
+        else:
+            if i < g:
+                g = i
+            f = i
+            while g >= 0 and pattern[g] == pattern[g+m-1-f]:
+                g -= 1
+            suff[i] = f - g
+    return suff
+
+
+def build_good_suffix_table(pattern: str) -> list[int]:
+    # gs[i] = shift when mismatch at i and pattern[i+1:] already matched
+    # O(m): built from suffixes table instead of comparing slices
+    m = len(pattern)
+    suff = build_suffixes(pattern)
+    # default shift = length of pattern
+    gs = [m] * m
+
+    # variant B: only a prefix of pattern matches part of good suffix
+    j = 0
+    for i in range(m-1, -1, -1):
+        if suff[i] == i + 1:
+            # pattern[:i+1] is also suffix of pattern
+            while j < m - 1 - i:
+                if gs[j] == m:
+                    gs[j] = m - 1 - i
+                j += 1
+
+    # variant A: good suffix occurs again, preceded by a different symbol
+    # going left to right so rightmost occurrence (smallest shift) wins
+    for i in range(m-1):
+        gs[m-1-suff[i]] = m - 1 - i
+    return gs
+
+
+class BoyerMoore:
+    # compiled pattern: tables are built once and only read during search,
+    # so one object can be shared between texts and threads
+    def __init__(self, pattern: str, use_good_suffix=False, dense=None):
+        pattern = as_pattern(pattern)
+        self.pattern = pattern
+        self.use_good_suffix = use_good_suffix
+        self.raw = is_bytes_like(pattern)
+        self.bad_char = build_bad_char_table(pattern, dense)
+        self.gs = build_good_suffix_table(pattern) if use_good_suffix and pattern else None
+        # after full match: gs[0] is the pattern period, without gs just step by one
+        self.match_shift = self.gs[0] if self.gs is not None else 1
+        # galil rule: after a match shifted by the period, the first m - period
+        # symbols of the next window are known to match and are not compared
+        # again, which keeps find-all linear for periodic patterns
+        self.match_keep = len(pattern) - self.match_shift if self.gs is not None else 0
+
+    def search(self, text: str, start=None, end=None) -> tuple[int | None, int, int]:
+        # first match with comparing and jumps counters
+        stats = SearchStats()
+        pos = next(self.finditer(text, stats, start, end), None)
+        return pos, stats.comparisons, stats.shifts
+
+    def finditer(self, text: str, stats=None, start=None, end=None):
+        # yields every (also overlapping) occurrence, left to right
+        # start/end: only matches inside text[start:end], absolute positions, no copy
+        pattern = self.pattern
+        check_types(text, pattern)
+        first, n = bounds(len(text), start, end) # n: scan stops here
+        m = len(pattern)
+        if not pattern:
+            yield from range(first, n + 1)
+            return
+        if stats is not None:
+            yield from self._finditer_counted(text, stats, first, n)
+            return
+
+        bad_char = self.bad_char
+        dense = type(bad_char) is list
+        size = len(bad_char)
+        raw = self.raw
+        gs = self.gs
+        match_shift = self.match_shift
+        match_keep = self.match_keep
+        low = 0 # window[:low] already known to match
+        window_idx = first
+        while window_idx <= n - m:
+            j = m - 1
+            while j >= low and text[window_idx+j] == pattern[j]:
+                j -= 1
+            if j < low:
+                yield window_idx
+                window_idx += match_shift
+                low = match_keep
+            else:
+                low = 0
+                sym = text[window_idx+j]
+                if dense:
+                    code = sym if raw else ord(sym)
+                    bc = bad_char[code] if code < size else -1
+                else:
+                    bc = bad_char.get(sym, -1)
+                shift = max(1, j-bc)
+                if gs is not None:
+                    shift = max(shift, gs[j])
+                window_idx += shift
+
+    def _finditer_counted(self, text, stats, first, n):
+        # same scan as finditer, with counters
+        pattern = self.pattern
         m = len(pattern)
-        # last always = 1
-        # default suffix = length of pattern
-        gs = ([m] * (m-1)) + [1]
-        for i in range(m-2, -1, -1):
-            suffix = pattern[i+1:]
-            k = m - i - 1
-            for j in range(i+1-k, -1, -1):
-                # check suffix and we must be at the beggining or first symbol before suffix dont match current symbol
-                if pattern[j:j+k] == suffix and (j == 0 or pattern[j-1] != pattern[i]):
-                    gs[i] = i - j # variant A: shfit, we found suffix
+        bad_char = self.bad_char
+        dense = type(bad_char) is list
+        size = len(bad_char)
+        raw = self.raw
+        gs = self.gs
+        match_shift = self.match_shift
+        match_keep = self.match_keep
+        low = 0
+        started = perf_counter()
+        window_idx = first
+        while window_idx <= n - m:
+            # moving from end of window to beginning
+            j = m - 1
+            while j >= low:
+                stats.comparisons += 1
+                if text[window_idx+j] != pattern[j]:
                     break
-            # if we didnt found suffix, looking varian B
-            if gs[i] == m:
-                while k > 0:
-                    if pattern[:k] == suffix[-k:]:
-                        gs[i] = max(1, m - k)
-                        break
-                    k -= 1
-        return gs
+                j -= 1
+            if j < low:
+                stats.scan_time += perf_counter() - started
+                yield window_idx
+                started = perf_counter()
+                window_idx += match_shift
+                low = match_keep
+            else:
+                low = 0
+                # if not found, jump using bad char table
+                sym = text[window_idx+j]
+                if dense:
+                    code = sym if raw else ord(sym)
+                    bc = bad_char[code] if code < size else -1
+                else:
+                    bc = bad_char.get(sym, -1)
+                shift = max(1, j-bc)
+                if gs is not None:
+                    # use good char shift and choose best
+                    shift = max(shift, gs[j])
+                window_idx += shift
+            stats.shifts += 1
+        stats.scan_time += perf_counter() - started
+
+
+def boyer_moore(text: str, pattern: str, use_good_suffix=False, casefold=False, start=None, end=None) -> tuple[int | None, int, int]:
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+    return compiled(BoyerMoore, pattern, use_good_suffix).search(text, start, end)
+
+
+def boyer_moore_finditer(text: str, pattern: str, use_good_suffix=False, stats=None, casefold=False, start=None, end=None):
+    # casefold=True: case insensitive, bad char table on folded pattern,
+    # text symbols folded while read (see FoldedText)
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+    matcher = timed(stats, compiled, BoyerMoore, pattern, use_good_suffix)
+    return matcher.finditer(text, stats, start, end)
+
 
+def boyer_moore_rfinditer(text: str, pattern: str, use_good_suffix=False, casefold=False, start=None, end=None):
+    # yields every (also overlapping) occurrence, right to left, so a search
+    # for the last match touches only the tail of text
+    # mirrored boyer-moore: window moves left, pattern is compared left to
+    # right and shifts come from tables of the reversed pattern
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    first, n = bounds(len(text), start, end)
+    m = len(pattern)
     if not pattern:
-        return 0, 0, 0   
+        yield from range(n, first - 1, -1)
+        return
 
-    if len(text) < len(pattern):
-        return None, 0, 0             
+    mirror = compiled(BoyerMoore, pattern[::-1], use_good_suffix)
+    bad_char = mirror.bad_char
+    dense = type(bad_char) is list
+    size = len(bad_char)
+    raw = mirror.raw
+    gs = mirror.gs
+    match_shift = mirror.match_shift
+    window_idx = n - m
+    while window_idx >= first:
+        j = 0
+        while j < m and text[window_idx+j] == pattern[j]:
+            j += 1
+        if j == m:
+            yield window_idx
+            window_idx -= match_shift
+        else:
+            # j from the left is m-1-j in reversed pattern
+            sym = text[window_idx+j]
+            if dense:
+                code = sym if raw else ord(sym)
+                bc = bad_char[code] if code < size else -1
+            else:
+                bc = bad_char.get(sym, -1)
+            shift = max(1, m - 1 - j - bc)
+            if gs is not None:
+                shift = max(shift, gs[m-1-j])
+            window_idx -= shift
 
-    bad_char = build_bad_char_table(pattern)
-    if use_good_suffix:
-        gs = build_good_suffix_table(pattern)       
 
-    m = len(pattern)    
-    comparing = 0
-    jumps = 0
+def boyer_moore_rfind(text: str, pattern: str, use_good_suffix=False, casefold=False, start=None, end=None) -> int | None:
+    # last occurrence like str.rfind, None when missing
+    return next(boyer_moore_rfinditer(text, pattern, use_good_suffix, casefold, start, end), None)
+
+
+#---------------------horspool------------------------------
+def build_horspool_table(pattern: str) -> dict[str, int] | list[int]:
+    # shift by distance from most right occurrence (last symbol excluded) to the end
+    m = len(pattern)
+    # dense table indexed by byte value for bytes
+    shift = [m] * 256 if is_bytes_like(pattern) else {}
+    for idx in range(m-1):
+        shift[pattern[idx]] = m - 1 - idx
+    return shift
+
+
+def horspool_finditer(text: str, pattern: str, stats=None, casefold=False):
+    # yields every (also overlapping) occurrence, left to right
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    n = len(text)
+    m = len(pattern)
+    if not pattern:
+        yield from range(n + 1)
+        return
+
+    shift = timed(stats, compiled, build_horspool_table, pattern)
+    if stats is not None:
+        yield from _horspool_counted(text, pattern, shift, stats)
+        return
+
+    dense = type(shift) is list
+    last = pattern[m-1]
     window_idx = 0
-    while window_idx <= (len(text)-m):
-        shift = 0
-        for j in range(m-1, -1, -1):
-            # moving from end of window to beginning
-            comparing += 1
+    while window_idx <= n - m:
+        sym = text[window_idx+m-1]
+        if sym == last:
+            # last symbol matched, check the rest from right to left
+            j = m - 2
+            while j >= 0 and text[window_idx+j] == pattern[j]:
+                j -= 1
+            if j < 0:
+                yield window_idx
+        # shift always depends only on last symbol of window
+        window_idx += shift[sym] if dense else shift.get(sym, m)
+
+
+def _horspool_counted(text, pattern, shift, stats):
+    n = len(text)
+    m = len(pattern)
+    dense = type(shift) is list
+    started = perf_counter()
+    window_idx = 0
+    while window_idx <= n - m:
+        j = m - 1
+        while j >= 0:
+            stats.comparisons += 1
             if text[window_idx+j] != pattern[j]:
-                # if not found, jump using bad char table
-                bc_shift = max(1, j-bad_char.get(text[window_idx+j], -1))
-                if use_good_suffix:
-                    # use good char shift and choose best
-                    gc_shift = gs[j]
-                    shift = max(bc_shift, gc_shift)
-                else:
-                    shift = bc_shift
-                window_idx += shift
-                jumps += 1
                 break
-        if shift == 0:
-            # if shift is zero, we found pattern
-            return window_idx, comparing, jumps
-    return None, comparing, jumps
+            j -= 1
+        if j < 0:
+            stats.scan_time += perf_counter() - started
+            yield window_idx
+            started = perf_counter()
+        sym = text[window_idx+m-1]
+        window_idx += shift[sym] if dense else shift.get(sym, m)
+        stats.shifts += 1
+    stats.scan_time += perf_counter() - started
 
 
-#-----------------------kmp---------------------------------
-def kmp(text: str, pattern: str) -> int | None:
+def horspool(text: str, pattern: str, stats=None, casefold=False) -> int | None:
+    return next(horspool_finditer(text, pattern, stats, casefold), None)
+
+
+#----------------------sunday-------------------------------
+def build_sunday_table(pattern: str) -> dict[str, int] | list[int]:
+    # shift by distance from most right occurrence to the symbol after window
+    m = len(pattern)
+    # dense table indexed by byte value for bytes
+    shift = [m + 1] * 256 if is_bytes_like(pattern) else {}
+    for idx, sym in enumerate(pattern):
+        shift[sym] = m - idx
+    return shift
+
 
+def sunday_finditer(text: str, pattern: str, stats=None, casefold=False):
+    # yields every (also overlapping) occurrence, left to right
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    n = len(text)
+    m = len(pattern)
     if not pattern:
-        return 0    
-    if len(text) < len(pattern):
-        return None
-    
-    def build_LPS(pattern: str) -> list:
-        # building LPS list
-        lps = [0] * len(pattern)
-        m = len(pattern)
+        yield from range(n + 1)
+        return
+
+    shift = timed(stats, compiled, build_sunday_table, pattern)
+    if stats is not None:
+        yield from _sunday_counted(text, pattern, shift, stats)
+        return
+
+    dense = type(shift) is list
+    window_idx = 0
+    while window_idx <= n - m:
         j = 0
-        i = 1
+        while j < m and text[window_idx+j] == pattern[j]:
+            j += 1
+        if j == m:
+            yield window_idx
+        if window_idx + m >= n:
+            # no symbol after window, nothing to shift by
+            break
+        # shift depends on symbol right after the window
+        sym = text[window_idx+m]
+        window_idx += shift[sym] if dense else shift.get(sym, m + 1)
 
-        while i < m:
-            if pattern[j] == pattern[i]:
-                # if match, move next and "remember" in LPS count of total matching
-                j += 1
-                lps[i] = j
+
+def _sunday_counted(text, pattern, shift, stats):
+    n = len(text)
+    m = len(pattern)
+    dense = type(shift) is list
+    started = perf_counter()
+    window_idx = 0
+    while window_idx <= n - m:
+        j = 0
+        while j < m:
+            stats.comparisons += 1
+            if text[window_idx+j] != pattern[j]:
+                break
+            j += 1
+        if j == m:
+            stats.scan_time += perf_counter() - started
+            yield window_idx
+            started = perf_counter()
+        if window_idx + m >= n:
+            break
+        sym = text[window_idx+m]
+        window_idx += shift[sym] if dense else shift.get(sym, m + 1)
+        stats.shifts += 1
+    stats.scan_time += perf_counter() - started
+
+
+def sunday(text: str, pattern: str, stats=None, casefold=False) -> int | None:
+    return next(sunday_finditer(text, pattern, stats, casefold), None)
+
+
+#-----------------------kmp---------------------------------
+def build_LPS(pattern: str) -> list:
+    # building LPS list
+    lps = [0] * len(pattern)
+    m = len(pattern)
+    j = 0
+    i = 1
+
+    while i < m:
+        if pattern[j] == pattern[i]:
+            # if match, move next and "remember" in LPS count of total matching
+            j += 1
+            lps[i] = j
+            i += 1
+        else:
+            # are we at beginning?
+            if j > 0:
+                # no, check backward
+                j = lps[j-1]
+            else:
+                # yes, start from 0
+                j = 0
+                lps[i] = 0
                 i += 1
-            else:         
-                # are we at beginning?       
-                if j > 0: 
-                    # no, check backward
-                    j = lps[j-1]
-                else:
-                    # yes, start from 0
-                    j = 0 
-                    lps[i] = 0
-                    i += 1
-        return lps
+    return lps
 
-    lps = build_LPS(pattern)
 
-    n = len(text)
+DFA_MAX_CELLS = 1 << 18 # transition table cells, ~2 MB of list slots
+
+
+def dfa_cells(pattern) -> int:
+    # bytes: dense rows of 256, str: sparse rows of pattern alphabet
+    width = 256 if is_bytes_like(pattern) else len(set(pattern))
+    return (len(pattern) + 1) * width
+
+
+def build_kmp_dfa(pattern, lps=None) -> list:
+    # KMP automaton: state j = matched prefix length, one lookup per symbol
+    # row j is row lps[j-1] (where the mismatch would fall back to)
+    # with the forward edge pattern[j] -> j+1 added
+    # bytes: flat list, state j stored as j*256, next = dfa[state + byte]
+    # str: list of dicts, symbols missing from a row go to state 0
+    if lps is None:
+        lps = build_LPS(pattern)
+    m = len(pattern)
+    if is_bytes_like(pattern):
+        dfa = [0] * (256 * (m + 1))
+        dfa[pattern[0]] = 256
+        for j in range(1, m + 1):
+            row = 256 * j
+            back = 256 * lps[j-1]
+            dfa[row:row+256] = dfa[back:back+256]
+            if j < m:
+                dfa[row + pattern[j]] = row + 256
+        return dfa
+    dfa = [{pattern[0]: 1}]
+    for j in range(1, m + 1):
+        row = dict(dfa[lps[j-1]])
+        if j < m:
+            row[pattern[j]] = j + 1
+        dfa.append(row)
+    return dfa
+
+
+def kmp_finditer(text: str, pattern: str, stats=None, mode="auto", casefold=False, start=None, end=None):
+    # yields every (also overlapping) occurrence, left to right
+    # mode: "lps" - classic fallback through lps
+    #       "dfa" - precomputed automaton, exactly one lookup per symbol
+    #       "auto" - dfa while its table fits in DFA_MAX_CELLS
+    # start/end: only matches inside text[start:end], absolute positions, no copy
+    if mode not in ("auto", "lps", "dfa"):
+        raise ValueError(f"unknown mode: {mode}")
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    first, n = bounds(len(text), start, end) # n: scan stops here
     m = len(pattern)
-    i = 0 # text pointer
+    if not pattern:
+        yield from range(first, n + 1)
+        return
+
+    if n - first < m:
+        return
+
+    if mode == "dfa" or (mode == "auto" and dfa_cells(pattern) <= DFA_MAX_CELLS):
+        yield from _kmp_dfa_finditer(text, pattern, stats, first, n)
+        return
+
+    lps = timed(stats, compiled, build_LPS, pattern)
+    if stats is not None:
+        yield from _kmp_counted(text, pattern, lps, stats, first, n)
+        return
+
+    i = first # text pointer
     j = 0 # pattern pointer
-    while i < n and j < m:
+    while i < n:
         if pattern[j] == text[i]:
             # "naive search". just move forward
             i += 1
             j += 1
+            if j == m:
+                yield i - m
+                # continue with the longest border of matched pattern
+                j = lps[j-1]
         else:
             # are we at begining?
-            if j > 0:            
+            if j > 0:
                 # use previous matching part
                 j = lps[j-1]
             else:
                 # go to the next symbol, start over
                 i += 1
-    if j == m:
-        return i - m
+
+
+def _kmp_dfa_finditer(text, pattern, stats, first, n):
+    m = len(pattern)
+    dfa = timed(stats, compiled, build_kmp_dfa, pattern)
+    if stats is not None:
+        yield from _kmp_dfa_counted(text, pattern, dfa, stats, first, n)
+        return
+    if is_bytes_like(text):
+        final = 256 * m
+        state = 0
+        for i, code in enumerate(symbols(text, first, n), first):
+            state = dfa[state + code]
+            if state == final:
+                yield i - m + 1
     else:
-        return None
-        
+        state = 0
+        for i, sym in enumerate(symbols(text, first, n), first):
+            state = dfa[state].get(sym, 0)
+            if state == m:
+                yield i - m + 1
 
-#-------------------rabin_karp------------------------------
-def rabin_karp(text, pattern):
 
-    def hash_window(s):
-        h = 0
-        for i in range(m):
-            h = (h * base + ord(s[i])) % q
-        return h
+def _kmp_dfa_counted(text, pattern, dfa, stats, first, n):
+    # comparisons - table lookups (one per symbol)
+    # shifts - transitions that do not extend the current match
+    m = len(pattern)
+    raw = is_bytes_like(text)
+    width = 256 if raw else 1
+    started = perf_counter()
+    state = 0
+    for i in range(first, n):
+        stats.comparisons += 1
+        if raw:
+            nxt = dfa[state + text[i]]
+        else:
+            nxt = dfa[state].get(text[i], 0)
+        if nxt != state + width:
+            stats.shifts += 1
+        state = nxt
+        if state == width * m:
+            stats.scan_time += perf_counter() - started
+            yield i - m + 1
+            started = perf_counter()
+    stats.scan_time += perf_counter() - started
 
-    def rolling_hash(h, left, right):
-        h = (h - ord(left) * high) % q
-        h = (h * base + ord(right)) % q
-        return h
 
+def _kmp_counted(text, pattern, lps, stats, first, n):
+    m = len(pattern)
+    started = perf_counter()
+    i = first
+    j = 0
+    while i < n:
+        stats.comparisons += 1
+        if pattern[j] == text[i]:
+            i += 1
+            j += 1
+            if j == m:
+                stats.scan_time += perf_counter() - started
+                yield i - m
+                started = perf_counter()
+                j = lps[j-1]
+                stats.shifts += 1
+        else:
+            if j > 0:
+                j = lps[j-1]
+            else:
+                i += 1
+            stats.shifts += 1
+    stats.scan_time += perf_counter() - started
+
+
+def kmp(text: str, pattern: str, stats=None, mode="auto", casefold=False, start=None, end=None) -> int | None:
+    return next(kmp_finditer(text, pattern, stats, mode, casefold, start, end), None)
+
+
+def kmp_rfinditer(text: str, pattern: str, casefold=False, start=None, end=None):
+    # yields every (also overlapping) occurrence, right to left:
+    # kmp over text read backwards with lps of the reversed pattern
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    first, n = bounds(len(text), start, end)
+    m = len(pattern)
     if not pattern:
-        return 0    
-    if len(text) < len(pattern):
-        return None        
+        yield from range(n, first - 1, -1)
+        return
 
-    q = 2 ** 31 - 1 # Mersen
+    reverse = pattern[::-1]
+    lps = compiled(build_LPS, reverse)
+    i = n - 1 # text pointer, moves left
+    j = 0 # reversed pattern pointer
+    while i >= first:
+        if reverse[j] == text[i]:
+            j += 1
+            if j == m:
+                # matched text[i:i+m]
+                yield i
+                j = lps[j-1]
+            i -= 1
+        elif j > 0:
+            j = lps[j-1]
+        else:
+            i -= 1
+
+
+def kmp_rfind(text: str, pattern: str, casefold=False, start=None, end=None) -> int | None:
+    # last occurrence like str.rfind, None when missing
+    return next(kmp_rfinditer(text, pattern, casefold, start, end), None)
+
+
+#---------------------two_way-------------------------------
+def maximal_suffix(pattern, reverse=False) -> tuple[int, int]:
+    # start-1 of the maximal suffix and its period
+    # reverse=True uses the opposite symbol order
+    m = len(pattern)
+    ms = -1 # maximal suffix starts at ms+1
+    j = 0 # candidate suffix starts at j+1
+    k = 1 # offset inside the current period
+    period = 1
+    while j + k < m:
+        a = pattern[j+k]
+        b = pattern[ms+k]
+        if a == b:
+            if k == period:
+                j += period
+                k = 1
+            else:
+                k += 1
+        elif (a > b) if reverse else (a < b):
+            # candidate is smaller, whole prefix up to it is one period
+            j += k
+            k = 1
+            period = j - ms
+        else:
+            # candidate is greater, it becomes the maximal suffix
+            ms = j
+            j = ms + 1
+            k = period = 1
+    return ms, period
+
+
+def critical_factorization(pattern) -> tuple[int, int, bool]:
+    # (ell, period, periodic): pattern splits into pattern[:ell+1] and
+    # pattern[ell+1:], the later of two maximal suffixes is critical
+    # periodic=False means period is only a safe shift, not the real one
+    ell, period = maximal_suffix(pattern)
+    ell2, period2 = maximal_suffix(pattern, reverse=True)
+    if ell2 > ell:
+        ell, period = ell2, period2
+    m = len(pattern)
+    # left part repeats one period later -> pattern is periodic
+    periodic = ell + period < m and all(pattern[k] == pattern[k+period] for k in range(ell + 1))
+    if not periodic:
+        period = max(ell + 1, m - ell - 1) + 1
+    return ell, period, periodic
+
+
+def two_way_finditer(text, pattern, stats=None, casefold=False):
+    # Crochemore-Perrin: O(1) extra memory, linear worst case
+    # right part is compared left to right, then left part right to left;
+    # for periodic patterns memory remembers the prefix already matched
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    n = len(text)
+    m = len(pattern)
+    if not pattern:
+        yield from range(n + 1)
+        return
+    if n < m:
+        return
+
+    ell, period, periodic = timed(stats, compiled, critical_factorization, pattern)
+    if stats is not None:
+        yield from _two_way_counted(text, pattern, ell, period, periodic, stats)
+        return
+
+    j = 0
+    memory = -1 # pattern[:memory+1] is known to match at j
+    while j <= n - m:
+        i = max(ell, memory) + 1
+        while i < m and pattern[i] == text[i+j]:
+            i += 1
+        if i >= m:
+            i = ell
+            while i > memory and pattern[i] == text[i+j]:
+                i -= 1
+            if i <= memory:
+                yield j
+            j += period
+            if periodic:
+                memory = m - period - 1
+        else:
+            j += i - ell
+            memory = -1
+
+
+def _two_way_counted(text, pattern, ell, period, periodic, stats):
+    n = len(text)
+    m = len(pattern)
+    started = perf_counter()
+    j = 0
+    memory = -1
+    while j <= n - m:
+        i = max(ell, memory) + 1
+        while i < m:
+            stats.comparisons += 1
+            if pattern[i] != text[i+j]:
+                break
+            i += 1
+        if i >= m:
+            i = ell
+            while i > memory:
+                stats.comparisons += 1
+                if pattern[i] != text[i+j]:
+                    break
+                i -= 1
+            if i <= memory:
+                stats.scan_time += perf_counter() - started
+                yield j
+                started = perf_counter()
+            j += period
+            if periodic:
+                memory = m - period - 1
+        else:
+            j += i - ell
+            memory = -1
+        stats.shifts += 1
+    stats.scan_time += perf_counter() - started
+
+
+def two_way(text, pattern, stats=None, casefold=False) -> int | None:
+    return next(two_way_finditer(text, pattern, stats, casefold), None)
+
+
+#----------------------bitap--------------------------------
+def build_bitap_masks(pattern) -> dict[str, int] | list[int]:
+    # bit i of masks[sym] is set when pattern[i] == sym
+    # python ints are unbounded, so any pattern length fits one bit vector
+    masks = [0] * 256 if is_bytes_like(pattern) else {}
+    for idx, sym in enumerate(pattern):
+        if isinstance(masks, dict):
+            masks[sym] = masks.get(sym, 0) | (1 << idx)
+        else:
+            masks[sym] |= 1 << idx
+    return masks
+
+
+def shift_or_finditer(text, pattern, stats=None, casefold=False):
+    # exact bit-parallel scan, one shift/or/and per text symbol:
+    # state bit i is set while pattern[:i+1] ends at current symbol
+    # (shift-and form of shift-or: python ints are unbounded, so the
+    # complemented vector of shift-or would need an extra mask per step)
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    n = len(text)
+    m = len(pattern)
+    if not pattern:
+        yield from range(n + 1)
+        return
+    if n < m:
+        return
+
+    masks = timed(stats, compiled, build_bitap_masks, pattern)
+    if stats is not None:
+        yield from _shift_or_counted(text, pattern, masks, stats)
+        return
+    yield from _shift_and(text, m, masks)
+
+
+def _shift_and(text, m, masks, default=0, first=0):
+    # scan loop of shift_or, default: mask of symbols missing from masks dict,
+    # first: only matches starting there or later
+    found = 1 << (m - 1)
+    state = 0
+    if is_bytes_like(text):
+        for i, code in enumerate(symbols(text, first), first):
+            state = ((state << 1) | 1) & masks[code]
+            if state & found:
+                yield i - m + 1
+    else:
+        get = masks.get
+        for i, sym in enumerate(symbols(text, first), first):
+            state = ((state << 1) | 1) & get(sym, default)
+            if state & found:
+                yield i - m + 1
+
+
+def _shift_or_counted(text, pattern, masks, stats):
+    # comparisons - mask lookups, shifts - bit vector shifts (one per symbol each)
+    m = len(pattern)
+    raw = is_bytes_like(text)
+    found = 1 << (m - 1)
+    started = perf_counter()
+    state = 0
+    for i in range(len(text)):
+        sym = text[i]
+        stats.comparisons += 1
+        stats.shifts += 1
+        state = ((state << 1) | 1) & (masks[sym] if raw else masks.get(sym, 0))
+        if state & found:
+            stats.scan_time += perf_counter() - started
+            yield i - m + 1
+            started = perf_counter()
+    stats.scan_time += perf_counter() - started
+
+
+def shift_or(text, pattern, stats=None, casefold=False) -> int | None:
+    return next(shift_or_finditer(text, pattern, stats, casefold), None)
+
+
+def bitap_finditer(text, pattern, k=1, metric="levenshtein", casefold=False):
+    # approximate search (Wu-Manber bitap): yields (end, distance) for every
+    # end position where some substring text[start:end] is within distance k
+    # of pattern, distance is the smallest one; end is exclusive, for hamming
+    # the match is text[end-m:end]
+    # state[d] bit i: pattern[:i+1] matches a substring ending here with <= d errors
+    if metric not in ("hamming", "levenshtein"):
+        raise ValueError(f"unknown metric: {metric}")
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    m = len(pattern)
+    if not pattern:
+        raise ValueError("empty pattern is not supported")
+    if not 0 <= k < m:
+        raise ValueError("k must be in range [0, len(pattern))")
+
+    masks = compiled(build_bitap_masks, pattern)
+    raw = is_bytes_like(pattern)
+    levenshtein = metric == "levenshtein"
+    full = (1 << m) - 1
+    found = 1 << (m - 1)
+    # levenshtein: first d pattern symbols may be deleted before any text
+    state = [(1 << d) - 1 if levenshtein else 0 for d in range(k + 1)]
+    for i in range(len(text)):
+        sym = text[i]
+        mask = masks[sym] if raw else masks.get(sym, 0)
+        prev_old = state[0]
+        prev_new = ((prev_old << 1) | 1) & mask
+        state[0] = prev_new
+        best = 0 if prev_new & found else -1
+        for d in range(1, k + 1):
+            old = state[d]
+            # match | substitution
+            new = (((old << 1) | 1) & mask) | (prev_old << 1) | 1
+            if levenshtein:
+                # | extra text symbol | skipped pattern symbol
+                new |= prev_old | (prev_new << 1)
+            new &= full
+            state[d] = new
+            if best < 0 and new & found:
+                best = d
+            prev_old, prev_new = old, new
+        if best >= 0:
+            yield i + 1, best
+
+
+def bitap(text, pattern, k=1, metric="levenshtein", casefold=False) -> tuple[int, int] | None:
+    return next(bitap_finditer(text, pattern, k, metric, casefold), None)
+
+
+#---------------------wildcard------------------------------
+# wildcard symbol in pattern matches any one text symbol ("ID-??-2024")
+WILDCARD = "?"
+# boyer-moore can not shift past a wildcard, so shifts are at most the run of
+# fixed symbols before the last wildcard (trailing wildcards do not count);
+# bit-parallel engine is faster for shorter runs and small alphabets where
+# bad char shifts stay short anyway (task3.benchmark_wildcard)
+WILDCARD_MIN_RUN = 6
+WILDCARD_MIN_ALPHABET = 5
+# bad char rule alone is O(n*m) on repetitive text ("b" + "a"*m + "?" in
+# "a"*n), so boyer-moore gives up after this many comparisons per text
+# symbol and scans the rest with shift-and; on natural text it stays
+# well below one comparison per symbol
+WILDCARD_MAX_WORK = 4
+
+
+def wildcard_symbol(pattern, wildcard):
+    # wildcard as it appears in pattern: byte value for bytes-like patterns
+    if len(wildcard) != 1:
+        raise ValueError("wildcard must be a single symbol")
+    if is_bytes_like(pattern):
+        return ord(wildcard) if isinstance(wildcard, str) else wildcard[0]
+    if not isinstance(wildcard, str):
+        raise TypeError("wildcard must be str for str pattern")
+    return wildcard
+
+
+def build_wildcard_masks(pattern, wildcard) -> tuple[dict[str, int] | list[int], int]:
+    # shift-and masks where wildcard positions are set for every symbol,
+    # second item is the mask of symbols absent from pattern (wildcard bits only)
+    masks = build_bitap_masks(pattern)
+    if isinstance(masks, dict):
+        any_sym = masks.get(wildcard, 0)
+        for sym in masks:
+            masks[sym] |= any_sym
+    else:
+        any_sym = masks[wildcard]
+        masks = [mask | any_sym for mask in masks]
+    return masks, any_sym
+
+
+def build_wildcard_tables(pattern, wildcard) -> tuple:
+    # (bad char table, wild, checks, depth) for boyer-moore with wildcards:
+    # wild[j] - rightmost wildcard left of j, a mismatch at j may shift only
+    # up to it (wildcard matches the bad symbol too);
+    # checks - positions of fixed symbols, right to left;
+    # depth[j] - comparisons made when the mismatch is at j
+    bad_char = build_bad_char_table(pattern)
+    wild = [-1] * len(pattern)
+    for j in range(1, len(pattern)):
+        wild[j] = j - 1 if pattern[j-1] == wildcard else wild[j-1]
+    checks = [j for j in range(len(pattern) - 1, -1, -1) if pattern[j] != wildcard]
+    depth = [0] * len(pattern)
+    for k, j in enumerate(checks, 1):
+        depth[j] = k
+    return bad_char, wild, checks, depth
+
+
+def wildcard_boyer_moore_finditer(text, pattern, wildcard=WILDCARD, casefold=False):
+    # yields every (also overlapping) occurrence, left to right
+    # bad char rule only: good suffix table does not hold with wildcards;
+    # past WILDCARD_MAX_WORK * n comparisons the rest of text is scanned with
+    # shift-and, so the whole search stays O(n * m / w)
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+        wildcard = fold_case(wildcard)
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    wildcard = wildcard_symbol(pattern, wildcard)
+    n = len(text)
     m = len(pattern)
+    if not pattern:
+        yield from range(n + 1)
+        return
+
+    bad_char, wild, checks, depth = compiled(build_wildcard_tables, pattern, wildcard)
+    dense = type(bad_char) is list
+    size = len(bad_char)
+    raw = is_bytes_like(pattern)
+    budget = WILDCARD_MAX_WORK * n
+    work = 0
+    window_idx = 0
+    while window_idx <= n - m:
+        if work > budget:
+            masks, any_sym = compiled(build_wildcard_masks, pattern, wildcard)
+            yield from _shift_and(text, m, masks, any_sym, window_idx)
+            return
+        for j in checks:
+            if text[window_idx+j] != pattern[j]:
+                break
+        else:
+            yield window_idx
+            window_idx += 1
+            work += len(checks)
+            continue
+        work += depth[j]
+        sym = text[window_idx+j]
+        if dense:
+            code = sym if raw else ord(sym)
+            bc = bad_char[code] if code < size else -1
+        else:
+            bc = bad_char.get(sym, -1)
+        window_idx += max(1, j - max(bc, wild[j]))
+
+
+def wildcard_shift_or_finditer(text, pattern, wildcard=WILDCARD, casefold=False):
+    # yields every (also overlapping) occurrence, left to right
+    # one shift/or/and per text symbol whatever the wildcards: O(n * m / w)
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+        wildcard = fold_case(wildcard)
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    wildcard = wildcard_symbol(pattern, wildcard)
     n = len(text)
+    m = len(pattern)
+    if not pattern:
+        yield from range(n + 1)
+        return
+    if n < m:
+        return
+
+    masks, any_sym = compiled(build_wildcard_masks, pattern, wildcard)
+    yield from _shift_and(text, m, masks, any_sym)
+
+
+WILDCARD_ENGINES = {
+    "boyer_moore": wildcard_boyer_moore_finditer,
+    "shift_or": wildcard_shift_or_finditer,
+}
+
+
+def choose_wildcard_engine(text, pattern, wildcard=WILDCARD) -> str:
+    symbol = wildcard_symbol(pattern, wildcard)
+    j = len(pattern) - 1
+    while j >= 0 and pattern[j] == symbol:
+        j -= 1
+    run = 0
+    while j >= 0 and pattern[j] != symbol:
+        run += 1
+        j -= 1
+    alphabet = len(set(pattern).union(text[:ALPHABET_SAMPLE]) - {symbol})
+    if run >= WILDCARD_MIN_RUN and alphabet >= WILDCARD_MIN_ALPHABET:
+        return "boyer_moore"
+    return "shift_or"
+
+
+def wildcard_finditer(text, pattern, wildcard=WILDCARD, engine=None, casefold=False):
+    # every occurrence of pattern with wildcards, engine=None picks one
+    if engine is None:
+        engine = choose_wildcard_engine(text, pattern, wildcard)
+    if engine not in WILDCARD_ENGINES:
+        raise ValueError(f"unknown engine: {engine}")
+    return WILDCARD_ENGINES[engine](text, pattern, wildcard, casefold)
+
+
+def wildcard_search(text, pattern, wildcard=WILDCARD, engine=None, casefold=False) -> int | None:
+    return next(wildcard_finditer(text, pattern, wildcard, engine, casefold), None)
+
+
+#-------------------rabin_karp------------------------------
+# hash modes: (modulus, base) of every rolling hash
+# mod31      - legacy, base 256 < most cyrillic code points, so distinct
+#              windows collide structurally (e.g. "\x01Ĭ" and "\x02,")
+# mersenne61 - 2^61-1 with base above max code point, no structural collisions
+# double     - two independent 31-bit-sized hashes, both must match
+HASH_MODES = {
+    "mod31": ((2 ** 31 - 1, 256),),
+    "mersenne61": ((2 ** 61 - 1, 1114117),),
+    "double": ((2 ** 31 - 1, 256), (10 ** 9 + 7, 1114117)),
+}
+
+
+def hash_window(s, m, base, q, raw=False, start=0):
+    # polynomial hash of s[start:start+m], raw = s holds byte values already
+    h = 0
+    for i in range(start, start + m):
+        h = (h * base + (s[i] if raw else ord(s[i]))) % q
+    return h
+
+
+def pattern_hashes(pattern, hash_mode) -> tuple:
+    # (q, base, base^(m-1) mod q, pattern hash) for every hash of the mode
+    m = len(pattern)
+    raw = is_bytes_like(pattern)
+    return tuple(
+        (q, base, pow(base, m - 1, q), hash_window(pattern, m, base, q, raw))
+        for q, base in HASH_MODES[hash_mode]
+    )
+
+
+def match_at(text, pattern):
+    # check(i) -> text[i:i+m] == pattern without copying text
+    if isinstance(text, (str, bytes, bytearray)):
+        return partial(text.startswith, pattern)
+    m = len(pattern)
+    if isinstance(text, mmap.mmap):
+        return lambda i: text.find(pattern, i, i + m) == i
+    # memoryview slice is a view, not a copy
+    return lambda i: text[i:i+m] == pattern
+
+
+def rabin_karp_finditer(text, pattern, backend="python", stats=None, hash_mode="mod31", casefold=False, start=None, end=None):
+    # yields every (also overlapping) occurrence, left to right
+    # backend: "python", "numpy" or "auto" (numpy when installed)
+    # hash_mode: key of HASH_MODES, numpy backend supports "mod31" only
+    # casefold=True hashes folded code points (numpy folds one block at a time)
+    # start/end: only matches inside text[start:end], absolute positions, no copy
+    if hash_mode not in HASH_MODES:
+        raise ValueError(f"unknown hash mode: {hash_mode}")
+    if casefold:
+        text, pattern = casefolded(text, pattern)
+    if backend == "numpy" or (backend == "auto" and np is not None and hash_mode == "mod31"):
+        if hash_mode != "mod31":
+            raise ValueError("numpy backend supports only mod31 hash mode")
+        yield from rabin_karp_numpy_finditer(text, pattern, stats=stats, start=start, end=end)
+        return
+    if backend not in ("python", "auto"):
+        raise ValueError(f"unknown backend: {backend}")
+
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    m = len(pattern)
+    first, n = bounds(len(text), start, end) # n: scan stops here
+    if not pattern:
+        yield from range(first, n + 1)
+        return
+    if n - first < m:
+        return
+
+    started = perf_counter()
+    moduli = compiled(pattern_hashes, pattern, hash_mode)
+    raw = is_bytes_like(text)
+    matches = match_at(text, pattern)
+    last = n - m
+
+    if stats is not None:
+        # [q, base, high, pattern hash, window hash] for every hash
+        hashes = [
+            [q, base, high, pattern_hash, hash_window(text, m, base, q, raw, first)]
+            for q, base, high, pattern_hash in moduli
+        ]
+        stats.preprocess_time += perf_counter() - started
+        started = perf_counter()
+        for i in range(first, last + 1):
+            stats.comparisons += 1
+            if all(h[3] == h[4] for h in hashes):
+                stats.hash_hits += 1
+                if matches(i):
+                    stats.scan_time += perf_counter() - started
+                    yield i
+                    started = perf_counter()
+                else:
+                    stats.false_positives += 1
+            if i < last:
+                left, right = text[i], text[i+m]
+                if not raw:
+                    left, right = ord(left), ord(right)
+                for h in hashes:
+                    q, base, high = h[0], h[1], h[2]
+                    h[4] = ((h[4] - left * high) * base + right) % q
+                stats.shifts += 1
+        stats.scan_time += perf_counter() - started
+        return
+
+    if len(moduli) == 2:
+        (q1, base1, high1, pattern_hash1), (q2, base2, high2, pattern_hash2) = moduli
+        hash1 = hash_window(text, m, base1, q1, raw, first)
+        hash2 = hash_window(text, m, base2, q2, raw, first)
+        for i in range(first, last + 1):
+            if hash1 == pattern_hash1 and hash2 == pattern_hash2 and matches(i):
+                yield i
+            if i < last:
+                left, right = text[i], text[i+m]
+                if not raw:
+                    left, right = ord(left), ord(right)
+                hash1 = ((hash1 - left * high1) * base1 + right) % q1
+                hash2 = ((hash2 - left * high2) * base2 + right) % q2
+        return
+
+    (q, base, high, pattern_hash), = moduli
+    window_hash = hash_window(text, m, base, q, raw, first)
+    if raw:
+        # bytes: symbols are already numbers, no ord() in the loop
+        for i in range(first, last + 1):
+            if pattern_hash == window_hash and matches(i):
+                yield i
+            if i < last:
+                window_hash = ((window_hash - text[i] * high) * base + text[i+m]) % q
+    else:
+        for i in range(first, last + 1):
+            if pattern_hash == window_hash and matches(i):
+                yield i
+            if i < last:
+                window_hash = ((window_hash - ord(text[i]) * high) * base + ord(text[i+m])) % q
+
+
+def rabin_karp(text, pattern, backend="python", stats=None, hash_mode="mod31", casefold=False, start=None, end=None):
+    return next(rabin_karp_finditer(text, pattern, backend, stats, hash_mode, casefold, start, end), None)
+
+
+NUMPY_BLOCK = 1 << 16 # windows hashed per numpy pass
+
+
+def rabin_karp_numpy_finditer(text, pattern, block=NUMPY_BLOCK, stats=None, start=None, end=None):
+    # all window hashes of a block at once:
+    # weights base^k instead of rolling, so window i of block is
+    # (prefix[i+m] - prefix[i]) and equals pattern hash * base^i
+    # only candidate positions are verified in python
+    if np is None:
+        raise ImportError("numpy backend requires numpy")
+    check_types(text, pattern)
+    pattern = as_pattern(pattern)
+    m = len(pattern)
+    first, n = bounds(len(text), start, end) # n: scan stops here
+    if not pattern:
+        yield from range(first, n + 1)
+        return
+    if n - first < m:
+        return
+
+    started = perf_counter()
+    (q, base), = HASH_MODES["mod31"] # products of two residues fit in uint64
+    raw = is_bytes_like(text)
+    matches = match_at(text, pattern)
+
+    def codes(s, offset=0, count=-1):
+        # code points of s[offset:offset+count]: buffers are read in place
+        # (uint8 times uint64 powers gives uint64), str is encoded and folded
+        # bytes are copied block by block
+        if raw and not isinstance(s, FoldedBytes):
+            return np.frombuffer(s, dtype=np.uint8, count=count, offset=offset)
+        if count >= 0:
+            s = s[offset:offset+count]
+        if raw:
+            return np.frombuffer(s, dtype=np.uint8)
+        return np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+
+    # powers[k] = base^k mod q, filled by doubling: log(size) vector steps
+    size = min(block, n - first - m + 1) + m - 1
+    powers = np.ones(size, dtype=np.uint64)
+    length = 1
+    while length < size:
+        step = min(length, size - length)
+        powers[length:length+step] = powers[:step] * np.uint64(pow(base, length, q)) % np.uint64(q)
+        length += step
+
+    pattern_hash = np.uint64(int((codes(pattern) * powers[:m] % np.uint64(q)).sum()) % q)
+    if stats is not None:
+        stats.preprocess_time += perf_counter() - started
+        started = perf_counter()
+
+    for offset in range(first, n - m + 1, block):
+        stop = min(n, offset + block + m - 1)
+        c = codes(text, offset, stop - offset)
+        windows = len(c) - m + 1
+        # terms < 2^31, so prefix sums of a block never overflow uint64
+        prefix = np.zeros(len(c) + 1, dtype=np.uint64)
+        np.cumsum(c * powers[:len(c)] % np.uint64(q), out=prefix[1:])
+        # drop the view before yielding: a mapped file can not be closed
+        # while an array still points into it
+        del c
+        window_hash = (prefix[m:m+windows] - prefix[:windows]) % np.uint64(q)
+        target = pattern_hash * powers[:windows] % np.uint64(q)
+        candidates = np.flatnonzero(window_hash == target).tolist()
+        if stats is not None:
+            stats.comparisons += windows
+            stats.hash_hits += len(candidates)
+        for i in candidates:
+            pos = offset + i
+            if matches(pos):
+                if stats is not None:
+                    stats.scan_time += perf_counter() - started
+                yield pos
+                if stats is not None:
+                    started = perf_counter()
+            elif stats is not None:
+                stats.false_positives += 1
+    if stats is not None:
+        stats.scan_time += perf_counter() - started
+
+
+def rabin_karp_multi_finditer(text, patterns):
+    # one pass over text for a whole set of patterns:
+    # patterns grouped by length, each length keeps its own rolling hash
+    # and every window is checked against hash set of that length
+    # yields (position, pattern) ordered by position, then by length
+    q = 2 ** 31 - 1 # Mersen
     base = 256
-    high = base**(m-1) % q
-
-
-    pattern_hash = hash_window(pattern)
-    window_hash = hash_window(text[:m])
-    for i in range(n - m + 1):        
-        if pattern_hash == window_hash:
-            if text[i:i+m] == pattern:
-                return i
-        if i < n - m:
-            window_hash = rolling_hash(window_hash,text[i],text[i+m])
-    return None
+    raw = is_bytes_like(text)
+
+    by_length = {}
+    for pattern in dict.fromkeys(map(as_pattern, patterns)):
+        check_types(text, pattern)
+        if not pattern:
+            raise ValueError("empty pattern is not supported")
+        m = len(pattern)
+        # hash -> patterns with that hash (collisions are rare but possible)
+        by_length.setdefault(m, {}).setdefault(hash_window(pattern, m, base, q, raw), []).append(pattern)
+
+    n = len(text)
+    # [length, high power, window hash, hash table], only lengths that fit in text
+    groups = [
+        [m, base**(m-1) % q, hash_window(text, m, base, q, raw), table]
+        for m, table in sorted(by_length.items()) if m <= n
+    ]
+    for i in range(n):
+        left = text[i] if raw else ord(text[i])
+        for group in groups:
+            m, high, window_hash, table = group
+            if i + m > n:
+                continue
+            candidates = table.get(window_hash)
+            if candidates is not None:
+                for pattern in candidates:
+                    if text[i:i+m] == pattern:
+                        yield i, pattern
+            if i + m < n:
+                right = text[i+m] if raw else ord(text[i+m])
+                group[2] = ((window_hash - left * high) * base + right) % q
+
+#-------------------aho_corasick----------------------------
+CODE_BITS = 21 # enough for any unicode code point
+
+
+class AhoCorasick:
+    # multi-pattern automaton: trie + failure links (LPS idea for many patterns)
+    # transitions live in one flat dict keyed by (state << CODE_BITS) | code point,
+    # per-state data in int arrays, so memory grows only with trie size
+
+    def __init__(self, patterns):
+        self.patterns = list(dict.fromkeys(map(as_pattern, patterns))) # unique, keep order
+        if any(not p for p in self.patterns):
+            raise ValueError("empty pattern is not supported")
+        # bytes patterns: symbols are byte values already
+        self.raw = bool(self.patterns) and is_bytes_like(self.patterns[0])
+        if any(is_bytes_like(p) != self.raw for p in self.patterns):
+            raise TypeError("can not mix str and bytes patterns")
+        raw = self.raw
+
+        bits = CODE_BITS
+        goto = {}
+        parent = array("i", [0])
+        code = array("i", [0])
+        depth = array("i", [0])
+        term = array("i", [-1]) # index of pattern ending in state
+
+        # building trie
+        for idx, pattern in enumerate(self.patterns):
+            state = 0
+            for sym in pattern:
+                c = sym if raw else ord(sym)
+                key = (state << bits) | c
+                nxt = goto.get(key)
+                if nxt is None:
+                    nxt = len(parent)
+                    goto[key] = nxt
+                    parent.append(state)
+                    code.append(c)
+                    depth.append(depth[state] + 1)
+                    term.append(-1)
+                state = nxt
+            term[state] = idx
+
+        # failure links in BFS order (by depth), root children fall back to root
+        size = len(parent)
+        fail = array("i", [0]) * size
+        out = array("i", [0]) * size # nearest state on fail chain with a pattern
+        by_depth = sorted(range(1, size), key=depth.__getitem__)
+        for state in by_depth:
+            p = parent[state]
+            if p:
+                c = code[state]
+                f = fail[p]
+                while f and ((f << bits) | c) not in goto:
+                    f = fail[f]
+                fail[state] = goto.get((f << bits) | c, 0)
+            f = fail[state]
+            out[state] = f if term[f] >= 0 else out[f]
+
+        self.goto = goto
+        self.fail = fail
+        self.out = out
+        self.term = term
+
+    def finditer(self, text: str):
+        # yields (position, pattern) for every hit, ordered by end of match
+        bits = CODE_BITS
+        goto = self.goto
+        fail = self.fail
+        out = self.out
+        term = self.term
+        patterns = self.patterns
+        if patterns:
+            check_types(text, patterns[0])
+        raw = self.raw
+
+        state = 0
+        for i, sym in enumerate(symbols(text)):
+            c = sym if raw else ord(sym)
+            nxt = goto.get((state << bits) | c)
+            while nxt is None and state:
+                # mismatch: fall back like lps in kmp
+                state = fail[state]
+                nxt = goto.get((state << bits) | c)
+            state = nxt or 0
+
+            hit = state if term[state] >= 0 else out[state]
+            while hit:
+                pattern = patterns[term[hit]]
+                yield i - len(pattern) + 1, pattern
+                hit = out[hit]
+
+
+def aho_corasick_finditer(text: str, patterns):
+    return AhoCorasick(patterns).finditer(text)
+
+
+#---------------------search--------------------------------
+# engine selection, thresholds calibrated with task3.benchmark_engines
+# (pure python, 100k chars of natural / DNA / binary text):
+# - horspool wins for natural text and DNA on random slices at any length,
+#   but is O(n*m) on repetitive input ("b" + "a"*800 in "a"*200000: seconds),
+#   so long patterns go to good suffix boyer-moore, linear with the galil
+#   rule and at most ~3x slower than horspool on random slices
+# - for short binary patterns kmp beats every skip-based engine
+BINARY_ALPHABET = 2
+LONG_PATTERN = 64
+# alphabet is estimated from pattern and beginning of text
+ALPHABET_SAMPLE = 256
+
+ENGINES = {
+    "boyer_moore": boyer_moore_finditer,
+    "boyer_moore_gs": partial(boyer_moore_finditer, use_good_suffix=True),
+    "horspool": horspool_finditer,
+    "sunday": sunday_finditer,
+    "kmp": kmp_finditer,
+    "two_way": two_way_finditer,
+    "shift_or": shift_or_finditer,
+    "rabin_karp": rabin_karp_finditer,
+}
+
+
+def choose_engine(text: str, pattern: str) -> str:
+    # shift_or is not chosen: on short patterns the kmp automaton does one
+    # lookup per symbol where shift_or does lookup, shift, or, and (task3.calibrate)
+    if len(pattern) >= LONG_PATTERN:
+        return "boyer_moore_gs"
+    alphabet = len(set(pattern).union(text[:ALPHABET_SAMPLE]))
+    if alphabet <= BINARY_ALPHABET:
+        return "kmp"
+    return "horspool"
+
+
+def search(text: str, pattern: str, stats=None, casefold=False) -> int | None:
+    return next(ENGINES[choose_engine(text, pattern)](text, pattern, stats=stats, casefold=casefold), None)
+
+
+def engine_finditer(text, pattern, engine=None, casefold=False):
+    # every occurrence with named engine, None picks one with choose_engine
+    if engine is None:
+        engine = choose_engine(text, pattern)
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine: {engine}")
+    return ENGINES[engine](text, pattern, casefold=casefold)
+
+
+def count(text, pattern, engine=None, overlapping=True, casefold=False) -> int:
+    # number of matches, positions are not collected
+    # overlapping=False counts like str.count: a match starts after previous one ends
+    matches = engine_finditer(text, pattern, engine, casefold)
+    if overlapping:
+        return sum(1 for _ in matches)
+    m = len(pattern)
+    total = 0
+    allowed = 0 # first position where next counted match may start
+    for pos in matches:
+        if pos >= allowed:
+            total += 1
+            allowed = pos + m
+    return total
+
+
+def contains(text, pattern, engine=None, casefold=False) -> bool:
+    # stops at first match, no counters and no result tuple
+    for _ in engine_finditer(text, pattern, engine, casefold):
+        return True
+    return False
+
+
+#---------------------streaming-----------------------------
+def read_chunks(path, chunk_size=1 << 20, encoding="utf-8", errors="strict"):
+    # file as a sequence of decoded chunks, incremental decoder keeps
+    # multi-byte symbols that are split between two reads
+    # encoding=None gives raw bytes chunks, no decoding at all
+    if encoding is None:
+        with open(path, "rb") as f:
+            while data := f.read(chunk_size):
+                yield data
+        return
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(chunk_size)
+            chunk = decoder.decode(data, final=not data)
+            if chunk:
+                yield chunk
+            if not data:
+                break
+
+
+def kmp_stream_finditer(chunks, pattern: str):
+    # kmp never looks back in text, so only pattern pointer
+    # has to survive between chunks - no overlap buffer needed
+    if not pattern:
+        raise ValueError("empty pattern is not supported")
+    pattern = as_pattern(pattern)
+    m = len(pattern)
+    lps = build_LPS(pattern)
+
+    offset = 0 # global position of current chunk
+    j = 0 # pattern pointer, carried across chunks
+    for chunk in chunks:
+        check_types(chunk, pattern)
+        for i in range(len(chunk)):
+            sym = chunk[i]
+            while j > 0 and pattern[j] != sym:
+                # use previous matching part
+                j = lps[j-1]
+            if pattern[j] == sym:
+                j += 1
+                if j == m:
+                    yield offset + i - m + 1
+                    j = lps[j-1]
+        offset += len(chunk)
+
+
+def stream_finditer(chunks, pattern: str, engine="horspool"):
+    # yields global positions of all occurrences in a sequence of chunks,
+    # memory is one chunk plus m-1 symbols of the previous one
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine: {engine}")
+    if engine == "kmp":
+        yield from kmp_stream_finditer(chunks, pattern)
+        return
+    if not pattern:
+        raise ValueError("empty pattern is not supported")
+
+    finditer = ENGINES[engine]
+    keep = len(pattern) - 1
+    tail = None
+    offset = 0 # global position of buffer start
+    for chunk in chunks:
+        # match can not fit in tail alone, so nothing is reported twice
+        buffer = chunk if tail is None else tail + chunk
+        for pos in finditer(buffer, pattern):
+            yield offset + pos
+        cut = max(0, len(buffer) - keep)
+        tail = buffer[cut:]
+        offset += cut
+
 
 #-----------------------tests--------------------------------
 
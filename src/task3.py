@@ -5,13 +5,26 @@
 (вибір підрядків за вашим бажанням). На основі отриманих даних визначте найшвидший алгоритм для кожного тексту окремо та в цілому.
 '''
 
+from functools import partial
 from pathlib import Path
+import random
+import re
 import timeit
-from substring_search import boyer_moore, kmp, rabin_karp
+from substring_search import boyer_moore, kmp, rabin_karp, two_way, shift_or, rabin_karp_finditer, kmp_finditer, build_good_suffix_table, ENGINES, choose_engine, np, BoyerMoore, HASH_MODES, SearchStats, WILDCARD_ENGINES, choose_wildcard_engine
+from parallel_search import parallel_search
+from text_index import SuffixArray
+import os
 import pandas as pd
 
-def load_text(path: str) -> str:
-    return Path(path).read_text(encoding="utf-8", errors="ignore")
+def load_text(path: str, encodings=("utf-8", "cp1251")) -> str:
+    # strict decoding: "стаття 1" is cp1251, errors="ignore" used to drop all its cyrillic
+    data = Path(path).read_bytes()
+    for encoding in encodings[:-1]:
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            pass
+    return data.decode(encodings[-1])
 
 def pick_existing(text: str, length: int = 20) -> str:
     # deterministic: take a middle slice
@@ -56,6 +69,153 @@ def run_all(algos, text1, text2):
 
     return pd.concat([df1, df2], ignore_index=True)
 
+def benchmark_preprocessing(text, lengths=(10, 100, 1000, 2000, 5000), number=3, repeat=3):
+    # good suffix table build time vs pattern length
+    # periodic pattern is the worst case for suffix matching
+    out = []
+    for m in lengths:
+        patterns = {
+            "text": (text * (m // len(text) + 1))[:m],
+            "periodic": ("ab" * m)[:m],
+        }
+        for pname, pat in patterns.items():
+            times = timeit.repeat(lambda: build_good_suffix_table(pat), number=number, repeat=repeat)
+            out.append((m, pname, min(times) / number))
+    df = pd.DataFrame(out, columns=["pattern_len", "pattern_type", "time_s"])
+    df["time_per_char_s"] = df["time_s"] / df["pattern_len"]
+    return df
+
+def make_texts(natural, size=100_000, seed=1):
+    # same size texts over very different alphabets
+    rnd = random.Random(seed)
+    return {
+        "natural": (natural * (size // len(natural) + 1))[:size],
+        "dna": "".join(rnd.choice("ACGT") for _ in range(size)),
+        "binary": "".join(rnd.choice("01") for _ in range(size)),
+    }
+
+def count_all(finditer):
+    # full scan: time does not depend on where first match is
+    return lambda text, pattern: sum(1 for _ in finditer(text, pattern))
+
+def benchmark_engines(texts, lengths=(2, 4, 8, 16, 32, 64, 256, 1000), engines=ENGINES, number=1, repeat=3, seed=1):
+    rnd = random.Random(seed)
+    out = []
+    for tname, text in texts.items():
+        for m in lengths:
+            start = rnd.randrange(len(text) - m)
+            pat = text[start:start+m]
+            for aname, finditer in engines.items():
+                t = measure(count_all(finditer), text, pat, number=number, repeat=repeat)
+                out.append((tname, m, aname, t, choose_engine(text, pat)))
+    return pd.DataFrame(out, columns=["text", "pattern_len", "algo", "time_s", "chosen"])
+
+def calibrate(df):
+    # fastest engine per text kind and pattern length vs dispatcher choice
+    best = df.loc[df.groupby(["text", "pattern_len"])["time_s"].idxmin()]
+    best = best.rename(columns={"algo": "fastest"})
+    return best[["text", "pattern_len", "fastest", "chosen", "time_s"]]
+
+def benchmark_parallel(text, pattern, workers=(1, 2, 4, 8), scale=50, engine="horspool", repeat=3):
+    # find-all over scaled up article: speedup vs number of worker processes
+    big = text * scale
+    raw = big.encode("utf-8")
+    raw_pattern = pattern.encode("utf-8")
+    out = []
+    for w in workers:
+        for kind, t, p in (("str", big, pattern), ("bytes", raw, raw_pattern)):
+            times = timeit.repeat(lambda: parallel_search(t, p, engine, workers=w, find_all=True), number=1, repeat=repeat)
+            out.append((kind, w, min(times)))
+    df = pd.DataFrame(out, columns=["text_type", "workers", "time_s"])
+    single = df[df["workers"] == workers[0]].set_index("text_type")["time_s"]
+    df["speedup"] = single.loc[df["text_type"]].values / df["time_s"]
+    return df
+
+def benchmark_bad_char(texts, lengths=(3, 8, 20, 60), scale=10, repeat=5, seed=1):
+    # boyer-moore full scan with dense (list by code point) vs dict bad char table
+    rnd = random.Random(seed)
+    out = []
+    for tname, text in texts.items():
+        big = text * scale
+        for m in lengths:
+            start = rnd.randrange(len(big) - m)
+            pat = big[start:start+m]
+            for kind, dense in (("dict", False), ("dense", True)):
+                matcher = BoyerMoore(pat, dense=dense)
+                times = timeit.repeat(lambda: sum(1 for _ in matcher.finditer(big)), number=1, repeat=repeat)
+                out.append((tname, m, kind, min(times)))
+    df = pd.DataFrame(out, columns=["text", "pattern_len", "table", "time_s"])
+    wide = df.pivot_table(index=["text", "pattern_len"], columns="table", values="time_s").reset_index()
+    wide["speedup"] = wide["dict"] / wide["dense"]
+    return wide
+
+def benchmark_index(text, queries=100, lengths=(5, 20), engines=("horspool", "kmp", "boyer_moore"), seed=1):
+    # suffix array: one build, then every query is a binary search
+    # break_even = queries after which build + queries beats rescanning
+    rnd = random.Random(seed)
+    build = min(timeit.repeat(lambda: SuffixArray(text), number=1, repeat=3))
+    index = SuffixArray(text)
+    out = []
+    for m in lengths:
+        starts = [rnd.randrange(len(text) - m) for _ in range(queries)]
+        patterns = [text[start:start+m] for start in starts]
+        indexed = min(timeit.repeat(lambda: [index.find_all(p) for p in patterns], number=1, repeat=3)) / queries
+        for engine in engines:
+            scan = count_all(ENGINES[engine])
+            t = min(timeit.repeat(lambda: [scan(text, p) for p in patterns], number=1, repeat=3)) / queries
+            break_even = build / (t - indexed) if t > indexed else float("inf")
+            out.append((m, engine, t, indexed, build, break_even))
+    return pd.DataFrame(out, columns=["pattern_len", "engine", "scan_s", "index_s", "build_s", "break_even"])
+
+def benchmark_kmp_modes(texts, lengths=(4, 16, 64), repeat=3, seed=1):
+    # kmp full scan: lps fallback loop vs precomputed automaton
+    rnd = random.Random(seed)
+    out = []
+    for tname, text in texts.items():
+        for m in lengths:
+            start = rnd.randrange(len(text) - m)
+            pat = text[start:start+m]
+            for mode in ("lps", "dfa"):
+                t = measure(count_all(partial(kmp_finditer, mode=mode)), text, pat, number=1, repeat=repeat)
+                out.append((tname, m, mode, t))
+    df = pd.DataFrame(out, columns=["text", "pattern_len", "mode", "time_s"])
+    wide = df.pivot_table(index=["text", "pattern_len"], columns="mode", values="time_s").reset_index()
+    wide["speedup"] = wide["lps"] / wide["dfa"]
+    return wide
+
+def benchmark_collisions(texts, lengths=(2, 5, 20), repeat=3, seed=1):
+    # rabin-karp hash modes: hash hits, false positives and full scan time
+    rnd = random.Random(seed)
+    out = []
+    for tname, text in texts.items():
+        for m in lengths:
+            start = rnd.randrange(len(text) - m)
+            pat = text[start:start+m]
+            for mode in HASH_MODES:
+                stats = SearchStats()
+                found = sum(1 for _ in rabin_karp_finditer(text, pat, stats=stats, hash_mode=mode))
+                finditer = partial(rabin_karp_finditer, hash_mode=mode)
+                t = measure(count_all(finditer), text, pat, number=1, repeat=repeat)
+                out.append((tname, m, mode, found, stats.hash_hits, stats.false_positives, t))
+    return pd.DataFrame(out, columns=["text", "pattern_len", "hash_mode", "matches", "hash_hits", "false_positives", "time_s"])
+
+def benchmark_wildcard(texts, length=24, runs=(1, 2, 4, 6, 8, 12), repeat=3, seed=1):
+    # "?" with run fixed symbols after it: wildcard engines vs re (C)
+    rnd = random.Random(seed)
+    out = []
+    for tname, text in texts.items():
+        for run in runs:
+            start = rnd.randrange(len(text) - length)
+            pat = text[start:start+length]
+            pat = pat[:length-1-run] + "?" + pat[length-run:]
+            regex = re.compile(re.escape(pat).replace(r"\?", "."), re.S)
+            row = [tname, run, choose_wildcard_engine(text, pat)]
+            for finditer in WILDCARD_ENGINES.values():
+                row.append(measure(count_all(finditer), text, pat, number=1, repeat=repeat))
+            row.append(measure(lambda text, pat: sum(1 for _ in regex.finditer(text)), text, pat, number=1, repeat=repeat))
+            out.append(row)
+    return pd.DataFrame(out, columns=["text", "run", "chosen", *WILDCARD_ENGINES, "re"])
+
 def winners(df):
     by_text = df.groupby(["text", "pattern_type"])["time_s"].idxmin()
     overall = df.groupby(["pattern_type"])["time_s"].idxmin()
@@ -66,7 +226,11 @@ def main():
         "boyer_moore": boyer_moore,
         "kmp": kmp,
         "rabin_karp": rabin_karp,
+        "two_way": two_way,
+        "shift_or": shift_or,
     }
+    if np is not None:
+        algos["rabin_karp_numpy"] = partial(rabin_karp, backend="numpy")
 
     text1 = load_text("./data/стаття 1.txt")
     text2 = load_text("./data/стаття 2.txt")
@@ -103,6 +267,30 @@ def main():
     print("\n=== Overall winners per pattern type ===")
     print(overall_winners.sort_values(["pattern_type"]))
 
+    print("\n=== Engine calibration: fastest vs chosen by search() ===")
+    print(calibrate(benchmark_engines(make_texts(text2))).to_string(index=False))
+
+    print("\n=== Boyer-Moore bad char table: dense vs dict ===")
+    print(benchmark_bad_char({"article1": text1, "article2": text2}).to_string(index=False))
+
+    print("\n=== Suffix array: break-even query count vs full scan ===")
+    print(benchmark_index(text2).to_string(index=False))
+
+    print("\n=== KMP: lps vs automaton ===")
+    print(benchmark_kmp_modes(make_texts(text2)).to_string(index=False))
+
+    print("\n=== Rabin-Karp hash modes: collisions on real text ===")
+    print(benchmark_collisions({"article1": text1, "article2": text2}).to_string(index=False))
+
+    print("\n=== Wildcard patterns: engines vs re by symbols after last '?' ===")
+    print(benchmark_wildcard(make_texts(text2)).to_string(index=False))
+
+    print(f"\n=== Parallel find-all, {os.cpu_count()} cores: speedup vs workers ===")
+    print(benchmark_parallel(text2, "алгоритм").to_string(index=False))
+
+    print("\n=== Good suffix table: preprocessing time vs pattern length ===")
+    print(benchmark_preprocessing(text2))
+
     # optionally save
     df.to_csv("benchmark_results.csv", index=False)
 
@@ -0,0 +1,355 @@
+'''
+Індекси над незмінним текстом для повторних запитів: текст обробляється один раз,
+а кожен запит не сканує весь текст заново.
+'''
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from substring_search import as_pattern, check_types, is_bytes_like, symbols
+
+
+#-------------------suffix_array----------------------------
+def build_suffix_array(text) -> list[int]:
+    # prefix doubling: suffixes sorted by first 2k symbols from ranks of k,
+    # each round takes the second key order from the previous one in a single
+    # pass and does one stable counting sort by the first key -> O(n log n)
+    n = len(text)
+    if n == 0:
+        return []
+    sa = sorted(range(n), key=text.__getitem__)
+    rank = [0] * n
+    classes = 1
+    for t in range(1, n):
+        if text[sa[t]] != text[sa[t-1]]:
+            classes += 1
+        rank[sa[t]] = classes - 1
+
+    k = 1
+    while classes < n:
+        # order by second key: suffixes shorter than k+1 have empty second half
+        second = list(range(n - k, n))
+        second.extend(i - k for i in sa if i >= k)
+        # stable counting sort by first key
+        start = [0] * (classes + 1)
+        for r in rank:
+            start[r + 1] += 1
+        for r in range(classes):
+            start[r + 1] += start[r]
+        for i in second:
+            r = rank[i]
+            sa[start[r]] = i
+            start[r] += 1
+
+        new_rank = [0] * n
+        classes = 1
+        for t in range(1, n):
+            a, b = sa[t-1], sa[t]
+            if rank[a] != rank[b] or (rank[a+k] if a + k < n else -1) != (rank[b+k] if b + k < n else -1):
+                classes += 1
+            new_rank[b] = classes - 1
+        rank = new_rank
+        k *= 2
+    return sa
+
+
+def build_lcp(text, sa) -> list[int]:
+    # Kasai: lcp[t] = common prefix of suffixes sa[t-1] and sa[t], lcp[0] = 0
+    n = len(text)
+    rank = [0] * n
+    for t, i in enumerate(sa):
+        rank[i] = t
+    lcp = [0] * n
+    h = 0
+    for i in range(n):
+        t = rank[i]
+        if t == 0:
+            h = 0
+            continue
+        j = sa[t-1]
+        while i + h < n and j + h < n and text[i+h] == text[j+h]:
+            h += 1
+        lcp[t] = h
+        if h:
+            h -= 1
+    return lcp
+
+
+def build_min_tree(values) -> array:
+    # bottom-up segment tree: leaves tree[n:] are values, tree[i] is the
+    # minimum of its children, so a range minimum touches O(log n) nodes
+    n = len(values)
+    tree = array("i", [0]) * n
+    tree.extend(values)
+    for i in range(n - 1, 0, -1):
+        left, right = tree[2*i], tree[2*i+1]
+        tree[i] = left if left < right else right
+    return tree
+
+
+def range_min(tree, lo, hi) -> int:
+    # minimum of values[lo:hi] (hi > lo) from build_min_tree
+    n = len(tree) // 2
+    lo += n
+    hi += n
+    best = tree[lo]
+    while lo < hi:
+        if lo & 1:
+            best = min(best, tree[lo])
+            lo += 1
+        if hi & 1:
+            hi -= 1
+            best = min(best, tree[hi])
+        lo >>= 1
+        hi >>= 1
+    return best
+
+
+class SuffixArray:
+    # built once over a fixed text, every query is a binary search
+    # over sorted suffixes: O(m log n) instead of a full scan
+    # bytes-like text is copied to bytes (slices of memoryview/mmap
+    # can not be ordered against the pattern)
+
+    def __init__(self, text):
+        if is_bytes_like(text) and not isinstance(text, bytes):
+            text = bytes(text)
+        self.text = text
+        self.sa = build_suffix_array(text)
+        self.lcp = build_lcp(text, self.sa)
+        # leftmost start of a block of matching suffixes for find
+        self.min_tree = build_min_tree(self.sa)
+
+    def __len__(self):
+        return len(self.text)
+
+    def _pattern(self, pattern):
+        check_types(self.text, pattern)
+        return as_pattern(pattern)
+
+    def _lower(self, pattern):
+        # first suffix not smaller than pattern in its first m symbols
+        m = len(pattern)
+        text = self.text
+        return bisect_left(self.sa, pattern, key=lambda i: text[i:i+m])
+
+    def _upper(self, pattern, lo=0):
+        m = len(pattern)
+        text = self.text
+        return bisect_right(self.sa, pattern, lo=lo, key=lambda i: text[i:i+m])
+
+    def count(self, pattern) -> int:
+        # number of (also overlapping) occurrences, O(m log n)
+        pattern = self._pattern(pattern)
+        if not pattern:
+            return len(self.text) + 1
+        lo = self._lower(pattern)
+        return self._upper(pattern, lo) - lo
+
+    def find_all(self, pattern) -> list[int]:
+        # sorted positions of every (also overlapping) occurrence
+        # the block of matching suffixes ends where lcp drops below m
+        pattern = self._pattern(pattern)
+        m = len(pattern)
+        if not m:
+            return list(range(len(self.text) + 1))
+        text = self.text
+        sa = self.sa
+        lo = self._lower(pattern)
+        if lo == len(sa) or text[sa[lo]:sa[lo]+m] != pattern:
+            return []
+        hi = lo + 1
+        while hi < len(sa) and self.lcp[hi] >= m:
+            hi += 1
+        return sorted(sa[lo:hi])
+
+    def find(self, pattern) -> int | None:
+        # leftmost occurrence like str.find, None when missing
+        # O(m log n) whatever the number of occurrences
+        pattern = self._pattern(pattern)
+        if not pattern:
+            return 0
+        lo = self._lower(pattern)
+        hi = self._upper(pattern, lo)
+        return range_min(self.min_tree, lo, hi) if hi > lo else None
+
+
+#-------------------suffix_automaton------------------------
+class SuffixAutomaton:
+    # smallest automaton of all substrings, built online symbol by symbol
+    # queries walk the pattern: O(m log sigma), independent of text length
+    # layout: every per-state and per-edge value lives in an int array
+    # (4 bytes each, no python object per state or edge), so corpora of
+    # tens of megabytes fit in memory also while building
+
+    def __init__(self, text):
+        self.raw = is_bytes_like(text)
+        raw = self.raw
+
+        length = array("i", [0])
+        link = array("i", [-1])
+        first_end = array("i", [-1]) # end position of first occurrence
+        count = array("i", [0]) # 1 for states of text prefixes, 0 for clones
+        # transitions while building: root has an edge for every distinct
+        # symbol and is looked up most, so it keeps a small dict by code;
+        # other states have a few edges each, kept as linked lists in flat
+        # arrays and found by walking them
+        root = {}
+        head = array("i", [-1])
+        edge_code = array("i")
+        edge_target = array("i")
+        edge_next = array("i")
+
+        def find_edge(state, c):
+            # index of edge of state (not root) by code, -1 if none
+            e = head[state]
+            while e != -1 and edge_code[e] != c:
+                e = edge_next[e]
+            return e
+
+        def target(state, c):
+            if not state:
+                return root.get(c, -1)
+            e = find_edge(state, c)
+            return edge_target[e] if e != -1 else -1
+
+        def add_edge(state, c, to):
+            if not state:
+                root[c] = to
+                return
+            edge_code.append(c)
+            edge_target.append(to)
+            edge_next.append(head[state])
+            head[state] = len(edge_code) - 1
+
+        def new_state(size, suffix, end, occurs):
+            length.append(size)
+            link.append(suffix)
+            first_end.append(end)
+            count.append(occurs)
+            head.append(-1)
+            return len(length) - 1
+
+        last = 0
+        for i, sym in enumerate(symbols(text)):
+            c = sym if raw else ord(sym)
+            cur = new_state(length[last] + 1, 0, i, 1)
+            p = last
+            while p != -1 and target(p, c) == -1:
+                add_edge(p, c, cur)
+                p = link[p]
+            if p != -1:
+                q = target(p, c)
+                if length[p] + 1 == length[q]:
+                    link[cur] = q
+                else:
+                    clone = new_state(length[p] + 1, link[q], first_end[q], 0)
+                    e = head[q] # q is never root: it is a target
+                    while e != -1:
+                        add_edge(clone, edge_code[e], edge_target[e])
+                        e = edge_next[e]
+                    while p != -1 and target(p, c) == q:
+                        if p:
+                            edge_target[find_edge(p, c)] = clone
+                        else:
+                            root[c] = clone
+                        p = link[p]
+                    link[q] = clone
+                    link[cur] = clone
+            last = cur
+
+        # occurrences of a state = text prefixes in its suffix-link subtree,
+        # summed from longest states down (counting sort by length)
+        size = len(length)
+        by_length = array("i", [0]) * (len(text) + 2)
+        for l in length:
+            by_length[l + 1] += 1
+        for l in range(len(text) + 1):
+            by_length[l + 1] += by_length[l]
+        order = array("i", [0]) * size
+        for state in range(size):
+            order[by_length[length[state]]] = state
+            by_length[length[state]] += 1
+        for state in reversed(order):
+            if link[state] > 0:
+                count[link[state]] += count[state]
+        count[0] = len(text) + 1
+
+        # freeze transitions into arrays sorted by (state, code): edges of a
+        # state are codes[start[state]:start[state+1]], found by bisect
+        start = array("i", [0]) * (size + 1)
+        codes = array("i", [0]) * (len(edge_code) + len(root))
+        targets = array("i", [0]) * len(codes)
+        k = 0
+        for state in range(size):
+            start[state] = k
+            if state:
+                edges = []
+                e = head[state]
+                while e != -1:
+                    edges.append((edge_code[e], edge_target[e]))
+                    e = edge_next[e]
+                edges.sort()
+            else:
+                edges = sorted(root.items())
+            for c, to in edges:
+                codes[k] = c
+                targets[k] = to
+                k += 1
+        start[size] = k
+        self.start = start
+        self.codes = codes
+        self.targets = targets
+        self.length = length
+        self.link = link
+        self.first_end = first_end
+        self.occurrences = count
+
+    def __len__(self):
+        # number of states
+        return len(self.length)
+
+    def _walk(self, pattern):
+        # state reached by pattern from the root, -1 if pattern is not a substring
+        check_types(b"" if self.raw else "", pattern)
+        raw = self.raw
+        start = self.start
+        codes = self.codes
+        targets = self.targets
+        state = 0
+        for i in range(len(pattern)):
+            c = pattern[i] if raw else ord(pattern[i])
+            lo, hi = start[state], start[state+1]
+            k = bisect_left(codes, c, lo, hi)
+            if k == hi or codes[k] != c:
+                return -1
+            state = targets[k]
+        return state
+
+    def contains(self, pattern) -> bool:
+        return self._walk(pattern) != -1
+
+    def count(self, pattern) -> int:
+        # number of (also overlapping) occurrences
+        state = self._walk(pattern)
+        return self.occurrences[state] if state != -1 else 0
+
+    def find(self, pattern) -> int | None:
+        # leftmost occurrence like str.find, None when missing
+        state = self._walk(pattern)
+        if state == -1:
+            return None
+        return self.first_end[state] - len(pattern) + 1 if state else 0
+
+
+if __name__ == "__main__":
+    text = "ABCAABBCAABCBACBACA" * 100
+    index = SuffixArray(text)
+
+    print(f"Suffix array over {len(index)} symbols")
+    print(f"'CBACA' first at {index.find('CBACA')}, {index.count('CBACA')} times")
+    print(f"'XYZ' {index.count('XYZ')} times")
+
+    automaton = SuffixAutomaton(text)
+    print(f"Suffix automaton with {len(automaton)} states")
+    print(f"'CBACA' first at {automaton.find('CBACA')}, {automaton.count('CBACA')} times")
@@ -0,0 +1,86 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Додаємо src до шляху для імпорту
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from parallel_search import parallel_search, partitions
+from substring_search import ENGINES
+
+
+def naive_find_all(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+class TestPartitions:
+    """Тести поділу тексту на частини"""
+
+    def test_cover_all_windows_once(self):
+        """Тест: кожне вікно належить рівно одній частині"""
+        parts = partitions(100, 5, 4)
+        starts = [pos for start, stop in parts for pos in range(start, stop)]
+        assert starts == list(range(96))
+
+    def test_balanced(self):
+        """Тест: частини відрізняються не більше ніж на одне вікно"""
+        sizes = [stop - start for start, stop in partitions(103, 1, 4)]
+        assert max(sizes) - min(sizes) <= 1
+
+    def test_more_parts_than_windows(self):
+        """Тест: частин не більше, ніж вікон"""
+        assert partitions(5, 4, 10) == [(0, 1), (1, 2)]
+
+    def test_text_shorter_than_pattern(self):
+        """Тест: текст коротший за паттерн"""
+        assert partitions(3, 5, 4) == []
+
+
+class TestParallelSearch:
+    """Тести паралельного пошуку"""
+
+    def test_find_all_str(self):
+        """Тест: всі входження в str, зокрема на межах частин"""
+        text = "ABCAABBCAABCBACBACA" * 20
+        assert parallel_search(text, "CBACA", workers=3, find_all=True) == naive_find_all(text, "CBACA")
+
+    def test_find_all_bytes_shared_memory(self):
+        """Тест: bytes через спільну пам'ять"""
+        text = "пошук підрядка, пошук".encode("utf-8") * 10
+        pattern = "пошук".encode("utf-8")
+        assert parallel_search(text, pattern, workers=3, find_all=True) == naive_find_all(text, pattern)
+
+    def test_first_match(self):
+        """Тест: перше входження, навіть якщо воно в останній частині"""
+        text = "x" * 500 + "needle"
+        assert parallel_search(text, "needle", workers=3) == 500
+
+    def test_overlapping_matches_at_boundaries(self):
+        """Тест: входження, що перекриваються, не дублюються між частинами"""
+        text = "A" * 50
+        assert parallel_search(text, "AAA", workers=4, find_all=True) == list(range(48))
+
+    def test_no_match(self):
+        """Тест: жодного входження"""
+        assert parallel_search("ABC" * 100, "XYZ", workers=2) is None
+        assert parallel_search("ABC" * 100, "XYZ", workers=2, find_all=True) == []
+
+    def test_text_shorter_than_pattern(self):
+        """Тест: текст коротший за паттерн"""
+        assert parallel_search("AB", "ABC", workers=2) is None
+
+    @pytest.mark.parametrize("engine", list(ENGINES))
+    def test_every_engine(self, engine):
+        """Тест: будь-який алгоритм з ENGINES"""
+        text = "ABABCABAB" * 10
+        assert parallel_search(text, "ABAB", engine, workers=2, find_all=True) == naive_find_all(text, "ABAB")
+
+    def test_unknown_engine(self):
+        """Тест: невідомий алгоритм"""
+        with pytest.raises(ValueError):
+            parallel_search("ABC", "B", engine="grep")
+
+    def test_empty_pattern(self):
+        """Тест: порожній паттерн не підтримується"""
+        with pytest.raises(ValueError):
+            parallel_search("ABC", "")
@@ -5,7 +5,33 @@ from pathlib import Path
 # Додаємо src до шляху для імпорту
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from substring_search import boyer_moore, kmp, rabin_karp
+from substring_search import (
+    boyer_moore, kmp, rabin_karp,
+    BoyerMoore, build_good_suffix_table,
+    boyer_moore_finditer, kmp_finditer, rabin_karp_finditer,
+    AhoCorasick, aho_corasick_finditer,
+    rabin_karp_multi_finditer,
+    horspool, horspool_finditer, sunday, sunday_finditer,
+    search, choose_engine, ENGINES, LONG_PATTERN,
+    read_chunks, stream_finditer, kmp_stream_finditer,
+    map_file,
+    rabin_karp_numpy_finditer,
+    SearchStats,
+    build_bad_char_table, DENSE_LIMIT,
+    HASH_MODES,
+    build_kmp_dfa,
+    two_way, two_way_finditer, critical_factorization,
+    PatternCache, table_bytes, build_LPS,
+    FoldedText, fold_case,
+    bitap, bitap_finditer, build_bitap_masks,
+    shift_or, shift_or_finditer,
+    count, contains, engine_finditer,
+    bounds,
+    boyer_moore_rfinditer, boyer_moore_rfind, kmp_rfinditer, kmp_rfind,
+    wildcard_finditer, wildcard_search, choose_wildcard_engine, WILDCARD_ENGINES,
+    symbols,
+)
+import substring_search
 
 
 class TestBoyerMooreBasic:
@@ -515,6 +541,113 @@ class TestBoyerMooreSpecificIssues:
         assert jumps1 >= 0 and jumps2 >= 0
 
 
+class TestBoyerMooreCompiled:
+    """Тести для скомпільованого об'єкта BoyerMoore"""
+
+    def test_search_matches_function(self):
+        """Тест: search дає той самий результат, що й boyer_moore"""
+        text = "ABCAABBCAABCBACBACA"
+        pattern = "CBACA"
+        for use_gs in (False, True):
+            matcher = BoyerMoore(pattern, use_good_suffix=use_gs)
+            assert matcher.search(text) == boyer_moore(text, pattern, use_good_suffix=use_gs)
+
+    def test_reuse_across_texts(self):
+        """Тест: один об'єкт використовується для кількох текстів"""
+        matcher = BoyerMoore("fox", use_good_suffix=True)
+        texts = ["The quick brown fox", "no match here", "fox"]
+        positions = [matcher.search(text)[0] for text in texts]
+        assert positions == [16, None, 0]
+
+    def test_tables_built_once(self):
+        """Тест: таблиці будуються в конструкторі і не змінюються під час пошуку"""
+        matcher = BoyerMoore("ABAB", use_good_suffix=True)
+        bad_char, gs = matcher.bad_char, matcher.gs
+        matcher.search("ABABABAB")
+        matcher.search("XXXX")
+        assert matcher.bad_char is bad_char
+        assert matcher.gs is gs
+        assert (bad_char[ord("A")], bad_char[ord("B")]) == (2, 3)
+
+    def test_good_suffix_table_only_when_requested(self):
+        """Тест: таблиця good suffix не будується без use_good_suffix"""
+        assert BoyerMoore("ABAB").gs is None
+        assert BoyerMoore("ABAB", use_good_suffix=True).gs is not None
+
+    def test_empty_pattern(self):
+        """Тест: порожній паттерн"""
+        matcher = BoyerMoore("", use_good_suffix=True)
+        assert matcher.search("ABC") == (0, 0, 0)
+
+    def test_text_shorter_than_pattern(self):
+        """Тест: текст коротший за паттерн"""
+        assert BoyerMoore("ABCD").search("AB") == (None, 0, 0)
+
+    def test_shared_between_threads(self):
+        """Тест: один об'єкт у кількох потоках"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        matcher = BoyerMoore("needle", use_good_suffix=True)
+        texts = ["x" * i + "needle" + "y" * i for i in range(50)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            positions = list(pool.map(lambda t: matcher.search(t)[0], texts))
+        assert positions == list(range(50))
+
+
+class TestGoodSuffixTableLinear:
+    """Тести для лінійної побудови таблиці good suffix"""
+
+    @staticmethod
+    def reference_table(pattern):
+        # найменший зсув, що узгоджується з уже знайденим суфіксом
+        # і ставить інший символ навпроти місця неспівпадіння
+        m = len(pattern)
+        table = []
+        for i in range(m):
+            for shift in range(1, m + 1):
+                suffix_ok = all(k - shift < 0 or pattern[k - shift] == pattern[k] for k in range(i + 1, m))
+                if suffix_ok and (i - shift < 0 or pattern[i - shift] != pattern[i]):
+                    break
+            table.append(shift)
+        return table
+
+    @pytest.mark.parametrize("pattern", [
+        "A", "AB", "AAAA", "ABAB", "ABCABC", "ABABAB", "CBACA", "BAAA", "AAABBB", "ABBAAA",
+        "BBABBB", "ANPANMAN", "abracadabra", "GCAGAGAG",
+    ])
+    def test_matches_reference(self, pattern):
+        """Тест: таблиця збігається з означенням правила good suffix"""
+        assert build_good_suffix_table(pattern) == self.reference_table(pattern)
+
+    def test_table_length(self):
+        """Тест: довжина таблиці дорівнює довжині паттерна"""
+        assert len(build_good_suffix_table("ABCDEFG")) == 7
+
+    def test_shifts_positive(self):
+        """Тест: усі зсуви додатні і не більші за довжину паттерна"""
+        pattern = "ABAABABAABAAB"
+        table = build_good_suffix_table(pattern)
+        assert all(1 <= shift <= len(pattern) for shift in table)
+
+    @pytest.mark.parametrize("text, pattern, expected", [
+        ("BBAAAAA", "BAAA", 1),
+        ("BAAABABAAAAAABBB", "AAABBB", 10),
+        ("BBBBBAAAABBAAA", "ABBAAA", 8),
+        ("ABBABBBABABAAAABAB", "BBABBB", 1),
+    ])
+    def test_overlapping_suffix_occurrence(self, text, pattern, expected):
+        """Тест: суфікс, що повторюється з перекриттям, не пропускає входження"""
+        pos, comparing, jumps = boyer_moore(text, pattern, use_good_suffix=True)
+        assert pos == expected
+
+    def test_long_pattern(self):
+        """Тест: довгий періодичний паттерн будується швидко і коректно"""
+        pattern = "ab" * 2000 + "c"
+        text = "ab" * 3000 + "c"
+        pos, comparing, jumps = boyer_moore(text, pattern, use_good_suffix=True)
+        assert pos == 2000
+
+
 # ==================== KMP ALGORITHM TESTS ====================
 
 class TestKMPBasic:
@@ -1346,3 +1479,1560 @@ class TestRabinKarpSpecificCases:
         pos = rabin_karp(text, pattern)
         assert pos == 23
 
+
+# ==================== FIND-ALL ITERATOR TESTS ====================
+
+def naive_find_all(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+FINDITER_ENGINES = [
+    pytest.param(lambda t, p: boyer_moore_finditer(t, p), id="boyer_moore"),
+    pytest.param(lambda t, p: boyer_moore_finditer(t, p, use_good_suffix=True), id="boyer_moore_gs"),
+    pytest.param(kmp_finditer, id="kmp"),
+    pytest.param(rabin_karp_finditer, id="rabin_karp"),
+    pytest.param(horspool_finditer, id="horspool"),
+    pytest.param(sunday_finditer, id="sunday"),
+    pytest.param(two_way_finditer, id="two_way"),
+    pytest.param(shift_or_finditer, id="shift_or"),
+]
+
+
+@pytest.mark.parametrize("finditer", FINDITER_ENGINES)
+class TestFindIter:
+    """Тести генераторів пошуку всіх входжень"""
+
+    def test_all_occurrences(self, finditer):
+        """Тест: знаходить усі входження"""
+        assert list(finditer("hello world hello world", "world")) == [6, 18]
+
+    def test_overlapping_occurrences(self, finditer):
+        """Тест: входження, що перекриваються"""
+        assert list(finditer("AAAAA", "AA")) == [0, 1, 2, 3]
+        assert list(finditer("ABABABA", "ABA")) == [0, 2, 4]
+
+    def test_no_occurrences(self, finditer):
+        """Тест: жодного входження"""
+        assert list(finditer("ABCDEFG", "XYZ")) == []
+
+    def test_text_shorter_than_pattern(self, finditer):
+        """Тест: текст коротший за паттерн"""
+        assert list(finditer("AB", "ABCD")) == []
+
+    def test_empty_pattern(self, finditer):
+        """Тест: порожній паттерн збігається в кожній позиції, як у str.count"""
+        assert list(finditer("ABC", "")) == [0, 1, 2, 3]
+
+    def test_is_lazy(self, finditer):
+        """Тест: позиції видаються ліниво"""
+        it = finditer("AB" * 1000, "AB")
+        assert next(it) == 0
+        assert next(it) == 2
+
+    def test_first_matches_single_search(self, finditer):
+        """Тест: перше входження збігається з kmp"""
+        text = "ABCAABBCAABCBACBACA"
+        assert next(finditer(text, "CBACA")) == kmp(text, "CBACA") == 14
+
+    def test_matches_naive(self, finditer):
+        """Тест: порівняння з наївним пошуком"""
+        import random
+        rnd = random.Random(3)
+        for _ in range(300):
+            alphabet = rnd.choice(["AB", "ABC", "ACGT"])
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 40)))
+            pattern = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 6)))
+            assert list(finditer(text, pattern)) == naive_find_all(text, pattern)
+
+    def test_count_matches_str_count_for_unicode(self, finditer):
+        """Тест: кирилиця, неперекривні входження"""
+        text = "пошук підрядка, пошук у тексті, пошук"
+        assert len(list(finditer(text, "пошук"))) == text.count("пошук")
+
+
+# ==================== AHO-CORASICK TESTS ====================
+
+def naive_multi_find_all(text, patterns):
+    return sorted((i, p) for p in set(patterns) for i in naive_find_all(text, p))
+
+
+class TestAhoCorasick:
+    """Тести для автомата Ахо-Корасік"""
+
+    def test_classic_example(self):
+        """Тест: класичний приклад he/she/his/hers"""
+        hits = list(aho_corasick_finditer("ushers", ["he", "she", "his", "hers"]))
+        assert sorted(hits) == [(1, "she"), (2, "he"), (2, "hers")]
+
+    def test_hits_ordered_by_match_end(self):
+        """Тест: збіги видаються в порядку кінця входження"""
+        hits = list(aho_corasick_finditer("ushers", ["he", "she", "hers"]))
+        ends = [pos + len(p) for pos, p in hits]
+        assert ends == sorted(ends)
+
+    def test_nested_patterns(self):
+        """Тест: паттерни, що є суфіксами один одного"""
+        hits = sorted(aho_corasick_finditer("AAAA", ["A", "AA", "AAA"]))
+        assert hits == naive_multi_find_all("AAAA", ["A", "AA", "AAA"])
+
+    def test_no_hits(self):
+        """Тест: жодного збігу"""
+        assert list(aho_corasick_finditer("ABCDEFG", ["XYZ", "QQ"])) == []
+
+    def test_duplicate_patterns_reported_once(self):
+        """Тест: дублікати паттернів не дублюють збіги"""
+        hits = list(aho_corasick_finditer("ABAB", ["AB", "AB"]))
+        assert hits == [(0, "AB"), (2, "AB")]
+
+    def test_empty_pattern_rejected(self):
+        """Тест: порожній паттерн не підтримується"""
+        with pytest.raises(ValueError):
+            AhoCorasick(["AB", ""])
+
+    def test_unicode_patterns(self):
+        """Тест: кириличні ключові слова"""
+        text = "алгоритм пошуку підрядка, алгоритм Ахо-Корасік"
+        hits = sorted(aho_corasick_finditer(text, ["алгоритм", "пошук", "Корасік"]))
+        assert hits == [(0, "алгоритм"), (9, "пошук"), (26, "алгоритм"), (39, "Корасік")]
+
+    def test_reuse_automaton(self):
+        """Тест: автомат використовується для кількох текстів"""
+        automaton = AhoCorasick(["cat", "dog"])
+        assert list(automaton.finditer("hotdog")) == [(3, "dog")]
+        assert list(automaton.finditer("catalog")) == [(0, "cat")]
+
+    def test_matches_naive(self):
+        """Тест: порівняння з наївним пошуком кожного паттерна"""
+        import random
+        rnd = random.Random(5)
+        for _ in range(300):
+            alphabet = rnd.choice(["AB", "ABC", "ACGT"])
+            patterns = ["".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 5)))
+                        for _ in range(rnd.randint(1, 8))]
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 40)))
+            assert sorted(aho_corasick_finditer(text, patterns)) == naive_multi_find_all(text, patterns)
+
+    def test_many_patterns(self):
+        """Тест: багато паттернів, один прохід по тексту"""
+        patterns = [f"key{i:05d}" for i in range(10000)]
+        text = "xx key00042 yy key09999 zz"
+        hits = list(aho_corasick_finditer(text, patterns))
+        assert hits == [(3, "key00042"), (15, "key09999")]
+
+
+# ==================== MULTI-PATTERN RABIN-KARP TESTS ====================
+
+class TestRabinKarpMulti:
+    """Тести для багатопаттернового Рабіна-Карпа"""
+
+    def test_patterns_same_length(self):
+        """Тест: кілька паттернів однакової довжини"""
+        hits = list(rabin_karp_multi_finditer("the cat sat on the mat", ["cat", "mat", "dog"]))
+        assert hits == [(4, "cat"), (19, "mat")]
+
+    def test_patterns_different_lengths(self):
+        """Тест: паттерни різної довжини в одному проході"""
+        hits = list(rabin_karp_multi_finditer("ABCABC", ["A", "BC", "CAB"]))
+        assert hits == [(0, "A"), (1, "BC"), (2, "CAB"), (3, "A"), (4, "BC")]
+
+    def test_ordered_by_position_then_length(self):
+        """Тест: порядок за позицією, потім за довжиною"""
+        hits = list(rabin_karp_multi_finditer("AAAA", ["AAA", "A", "AA"]))
+        assert hits == sorted(hits, key=lambda hit: (hit[0], len(hit[1])))
+        assert sorted(hits) == naive_multi_find_all("AAAA", ["AAA", "A", "AA"])
+
+    def test_pattern_longer_than_text_skipped(self):
+        """Тест: паттерни, довші за текст, пропускаються"""
+        assert list(rabin_karp_multi_finditer("AB", ["ABC", "B"])) == [(1, "B")]
+
+    def test_empty_text(self):
+        """Тест: порожній текст"""
+        assert list(rabin_karp_multi_finditer("", ["A"])) == []
+
+    def test_empty_pattern_rejected(self):
+        """Тест: порожній паттерн не підтримується"""
+        with pytest.raises(ValueError):
+            list(rabin_karp_multi_finditer("ABC", ["A", ""]))
+
+    def test_blocklist_cyrillic(self):
+        """Тест: блок-лист кириличних слів"""
+        text = "заборонене слово і ще одне заборонене"
+        hits = list(rabin_karp_multi_finditer(text, ["заборонене", "слово", "інше"]))
+        assert hits == [(0, "заборонене"), (11, "слово"), (27, "заборонене")]
+
+    def test_matches_aho_corasick(self):
+        """Тест: ті самі збіги, що й в Ахо-Корасік"""
+        import random
+        rnd = random.Random(7)
+        for _ in range(300):
+            alphabet = rnd.choice(["AB", "ABC", "ACGT"])
+            patterns = ["".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 5)))
+                        for _ in range(rnd.randint(1, 8))]
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 40)))
+            expected = sorted(aho_corasick_finditer(text, patterns))
+            assert sorted(rabin_karp_multi_finditer(text, patterns)) == expected
+
+
+# ==================== HORSPOOL / SUNDAY / SEARCH TESTS ====================
+
+SINGLE_MATCH_CASES = [
+    ("ABCDEFG", "ABC", 0),
+    ("ABCDEFG", "EFG", 4),
+    ("ABCDEFG", "XYZ", None),
+    ("ABCAABBCAABCBACBACA", "CBACA", 14),
+    ("mississippi", "issip", 4),
+    ("The quick brown fox jumps over the lazy dog", "fox", 16),
+    ("AB", "ABCD", None),
+    ("ABC", "", 0),
+    ("", "", 0),
+    ("", "A", None),
+]
+
+
+@pytest.mark.parametrize("engine", [horspool, sunday, search])
+class TestSingleMatchEngines:
+    """Тести для Хорспула, Сандей і диспетчера search"""
+
+    @pytest.mark.parametrize("text, pattern, expected", SINGLE_MATCH_CASES)
+    def test_first_occurrence(self, engine, text, pattern, expected):
+        """Тест: перше входження збігається з очікуваним"""
+        assert engine(text, pattern) == expected
+
+    def test_pattern_at_very_end(self, engine):
+        """Тест: паттерн в самому кінці тексту (немає символу після вікна)"""
+        assert engine("XXXXAB", "AB") == 4
+
+    def test_last_symbol_repeated_in_pattern(self, engine):
+        """Тест: останній символ паттерна зустрічається в ньому ще раз"""
+        assert engine("ABCABDABAB", "ABAB") == 6
+
+    def test_cyrillic(self, engine):
+        """Тест: кирилиця"""
+        assert engine("порівняння алгоритмів пошуку", "пошуку") == 22
+
+
+class TestChooseEngine:
+    """Тести вибору алгоритму"""
+
+    def test_natural_text(self):
+        """Тест: звичайний текст - Хорспул"""
+        text = "The quick brown fox jumps over the lazy dog. " * 10
+        assert choose_engine(text, "lazy dog") == "horspool"
+
+    def test_long_binary_pattern(self):
+        """Тест: довгий паттерн над двійковим алфавітом - good suffix"""
+        text = "0110" * 1000
+        assert choose_engine(text, "01101001" * 10) == "boyer_moore_gs"
+
+    def test_dna(self):
+        """Тест: ДНК - Хорспул для коротких паттернів"""
+        text = "ACGT" * 1000
+        assert choose_engine(text, "ACG") == "horspool"
+
+    @pytest.mark.parametrize("text", ["The quick brown fox " * 100, "ACGT" * 1000, "0110" * 30])
+    def test_long_pattern_linear_engine(self, text):
+        """Тест: довгий паттерн на будь-якому алфавіті - лінійний good suffix"""
+        assert choose_engine(text, text[3:3 + LONG_PATTERN]) == "boyer_moore_gs"
+
+    def test_repetitive_text_long_pattern(self):
+        """Тест: повторюваний текст не робить search квадратичним"""
+        import time
+        text = "bcdef" + "a" * 200000
+        pattern = "b" + "a" * 800
+        started = time.perf_counter()
+        assert search(text, pattern) is None
+        assert count("a" * 20000, "a" * 800) == 20000 - 800 + 1
+        # horspool needs ~15 s here, the linear engine ~0.03 s
+        assert time.perf_counter() - started < 2
+
+    def test_short_binary_pattern(self):
+        """Тест: короткий двійковий паттерн - KMP"""
+        assert choose_engine("0110" * 100, "0101") == "kmp"
+
+    def test_all_choices_are_engines(self):
+        """Тест: вибраний алгоритм є в словнику ENGINES"""
+        for text, pattern in [("ACGT" * 100, "ACGTA" * 20), ("01" * 50, "011"), ("текст", "екс")]:
+            assert choose_engine(text, pattern) in ENGINES
+
+    def test_search_matches_str_find(self):
+        """Тест: search збігається з str.find на різних алфавітах"""
+        import random
+        rnd = random.Random(11)
+        for alphabet in ["01", "ACGT", "абвгдежз"]:
+            text = "".join(rnd.choice(alphabet) for _ in range(2000))
+            for m in (1, 2, 5, 70, 200):
+                start = rnd.randrange(len(text) - m)
+                pattern = text[start:start + m]
+                assert search(text, pattern) == text.find(pattern)
+
+
+# ==================== STREAMING TESTS ====================
+
+def split_chunks(text, size):
+    return (text[i:i + size] for i in range(0, len(text), size))
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+class TestStreamFindIter:
+    """Тести потокового пошуку по частинах тексту"""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 1000])
+    def test_match_across_chunk_boundary(self, engine, size):
+        """Тест: входження, розрізане межею частин"""
+        text = "xxABCABDxxABCABDxx"
+        found = list(stream_finditer(split_chunks(text, size), "ABCABD", engine))
+        assert found == [2, 10]
+
+    def test_overlapping_matches_reported_once(self, engine):
+        """Тест: входження, що перекриваються, не дублюються"""
+        found = list(stream_finditer(split_chunks("AAAAAAA", 2), "AAA", engine))
+        assert found == [0, 1, 2, 3, 4]
+
+    def test_empty_chunks(self, engine):
+        """Тест: порожні частини не ламають зсуви"""
+        found = list(stream_finditer(iter(["AB", "", "C", "", "ABC"]), "ABC", engine))
+        assert found == [0, 3]
+
+    def test_matches_finditer(self, engine):
+        """Тест: глобальні позиції збігаються з пошуком по всьому тексту"""
+        import random
+        rnd = random.Random(2)
+        for _ in range(100):
+            text = "".join(rnd.choice("ABC") for _ in range(rnd.randint(0, 60)))
+            pattern = "".join(rnd.choice("ABC") for _ in range(rnd.randint(1, 5)))
+            size = rnd.randint(1, 10)
+            assert list(stream_finditer(split_chunks(text, size), pattern, engine)) == naive_find_all(text, pattern)
+
+    def test_empty_pattern_rejected(self, engine):
+        """Тест: порожній паттерн не підтримується"""
+        with pytest.raises(ValueError):
+            list(stream_finditer(iter(["ABC"]), "", engine))
+
+
+class TestKMPStream:
+    """Тести KMP, що переносить стан між частинами"""
+
+    def test_state_carried_between_chunks(self):
+        """Тест: кожен символ в окремій частині"""
+        found = list(kmp_stream_finditer(iter("ABABABA"), "ABA"))
+        assert found == [0, 2, 4]
+
+    def test_lazy_over_infinite_stream(self):
+        """Тест: генератор працює з нескінченним потоком"""
+        import itertools
+        found = kmp_stream_finditer(itertools.repeat("abc"), "cab")
+        assert list(itertools.islice(found, 3)) == [2, 5, 8]
+
+    def test_unknown_engine(self):
+        """Тест: невідомий рушій - ValueError, як у count і parallel_search"""
+        with pytest.raises(ValueError, match="unknown engine"):
+            list(stream_finditer(iter(["ABC"]), "B", "regex"))
+
+
+class TestReadChunks:
+    """Тести читання файлу частинами"""
+
+    def test_multibyte_symbols_split_between_reads(self, tmp_path):
+        """Тест: кирилиця, розрізана межею читання"""
+        path = tmp_path / "text.txt"
+        text = "пошук підрядка у великому файлі"
+        path.write_text(text, encoding="utf-8")
+        chunks = list(read_chunks(path, chunk_size=3))
+        assert "".join(chunks) == text
+        assert len(chunks) > 1
+
+    def test_stream_over_file(self, tmp_path):
+        """Тест: потоковий пошук по файлу"""
+        path = tmp_path / "log.txt"
+        text = "INFO ok\nERROR disk\nINFO ok\nERROR net\n" * 50
+        path.write_text(text, encoding="utf-8")
+        found = list(stream_finditer(read_chunks(path, chunk_size=16), "ERROR"))
+        assert found == naive_find_all(text, "ERROR")
+
+    def test_other_encoding(self, tmp_path):
+        """Тест: файл у cp1251"""
+        path = tmp_path / "cp1251.txt"
+        path.write_bytes("алгоритм".encode("cp1251"))
+        assert "".join(read_chunks(path, chunk_size=2, encoding="cp1251")) == "алгоритм"
+
+    def test_invalid_bytes_raise(self, tmp_path):
+        """Тест: некоректні байти не відкидаються мовчки"""
+        path = tmp_path / "bad.txt"
+        path.write_bytes("алгоритм".encode("cp1251"))
+        with pytest.raises(UnicodeDecodeError):
+            list(read_chunks(path))
+
+
+# ==================== BYTES / MMAP TESTS ====================
+
+BYTES_ENGINES = FINDITER_ENGINES + [pytest.param(lambda t, p: stream_finditer(iter([t]), p, "kmp"), id="stream_kmp")]
+
+
+@pytest.fixture(params=["bytes", "bytearray", "memoryview", "mmap"])
+def as_buffer(request, tmp_path):
+    # перетворює bytes на потрібний тип буфера без декодування
+    opened = []
+
+    def convert(data):
+        if request.param == "bytes":
+            return data
+        if request.param == "bytearray":
+            return bytearray(data)
+        if request.param == "memoryview":
+            return memoryview(data)
+        path = tmp_path / f"data{len(opened)}.bin"
+        path.write_bytes(data)
+        mapped = map_file(path)
+        opened.append(mapped)
+        return mapped
+
+    yield convert
+    for mapped in opened:
+        mapped.close()
+
+
+@pytest.mark.parametrize("finditer", BYTES_ENGINES)
+class TestBytesSearch:
+    """Тести пошуку в bytes, bytearray, memoryview і mmap"""
+
+    def test_all_occurrences(self, finditer, as_buffer):
+        """Тест: всі входження в буфері"""
+        text = as_buffer(b"GET /a HTTP/1.1\r\nGET /b HTTP/1.1\r\n")
+        assert list(finditer(text, b"HTTP/1.1")) == [7, 24]
+
+    def test_high_byte_values(self, finditer, as_buffer):
+        """Тест: байти зі значеннями понад 127"""
+        data = b"\x00\xff\xfe\xff\xfe\x00"
+        assert list(finditer(as_buffer(data), b"\xff\xfe")) == [1, 3]
+
+    def test_utf8_encoded_cyrillic(self, finditer, as_buffer):
+        """Тест: кирилиця в UTF-8 без декодування"""
+        data = "пошук підрядка у байтах".encode("utf-8")
+        pattern = "підрядка".encode("utf-8")
+        assert list(finditer(as_buffer(data), pattern)) == [data.find(pattern)]
+
+    def test_matches_naive(self, finditer, as_buffer):
+        """Тест: порівняння з наївним пошуком"""
+        import random
+        rnd = random.Random(4)
+        for _ in range(50):
+            data = bytes(rnd.choice(b"ab\x00\xff") for _ in range(rnd.randint(1, 50)))
+            pattern = bytes(rnd.choice(b"ab\x00\xff") for _ in range(rnd.randint(1, 4)))
+            assert list(finditer(as_buffer(data), pattern)) == naive_find_all(data, pattern)
+
+
+class TestBytesApi:
+    """Тести API для двійкових даних"""
+
+    def test_bad_char_table_indexed_by_byte(self):
+        """Тест: таблиця bad character для bytes - список з 256 елементів"""
+        table = BoyerMoore(b"ABA").bad_char
+        assert isinstance(table, list) and len(table) == 256
+        assert table[ord("A")] == 2 and table[ord("B")] == 1 and table[0] == -1
+
+    def test_boyer_moore_counters_on_bytes(self):
+        """Тест: boyer_moore повертає лічильники і для bytes"""
+        pos, comparing, jumps = boyer_moore(b"ABCAABBCAABCBACBACA", b"CBACA", use_good_suffix=True)
+        assert pos == 14 and comparing > 0
+
+    @pytest.mark.parametrize("engine", [kmp, rabin_karp, horspool, sunday, search])
+    def test_mixed_types_rejected(self, engine):
+        """Тест: str паттерн у bytes тексті (і навпаки) - TypeError"""
+        with pytest.raises(TypeError):
+            engine(b"ABC", "A")
+        with pytest.raises(TypeError):
+            engine("ABC", b"A")
+
+    def test_aho_corasick_bytes(self):
+        """Тест: Ахо-Корасік над байтами"""
+        hits = list(aho_corasick_finditer(b"ushers", [b"he", b"she", b"hers"]))
+        assert sorted(hits) == [(1, b"she"), (2, b"he"), (2, b"hers")]
+
+    def test_aho_corasick_mixed_patterns_rejected(self):
+        """Тест: не можна змішувати str і bytes паттерни"""
+        with pytest.raises(TypeError):
+            AhoCorasick(["he", b"she"])
+
+    def test_rabin_karp_multi_bytes(self):
+        """Тест: багатопаттерновий Рабін-Карп над байтами"""
+        hits = list(rabin_karp_multi_finditer(b"the cat sat on the mat", [b"cat", b"mat"]))
+        assert hits == [(4, b"cat"), (19, b"mat")]
+
+    def test_read_chunks_raw(self, tmp_path):
+        """Тест: read_chunks без кодування повертає bytes"""
+        path = tmp_path / "raw.bin"
+        path.write_bytes(b"\xff" * 10)
+        chunks = list(read_chunks(path, chunk_size=4, encoding=None))
+        assert chunks == [b"\xff" * 4, b"\xff" * 4, b"\xff" * 2]
+
+    def test_stream_over_raw_file(self, tmp_path):
+        """Тест: потоковий пошук по сирих байтах файлу"""
+        path = tmp_path / "cp1251.txt"
+        data = "алгоритм пошуку, алгоритм".encode("cp1251")
+        path.write_bytes(data)
+        pattern = "алгоритм".encode("cp1251")
+        for engine in ("kmp", "horspool"):
+            found = list(stream_finditer(read_chunks(path, chunk_size=3, encoding=None), pattern, engine))
+            assert found == naive_find_all(data, pattern)
+
+    def test_symbols_are_byte_values(self, as_buffer):
+        """Тест: symbols дає значення байтів, також для mmap і для частини тексту"""
+        text = as_buffer(b"ABCDE")
+        assert list(symbols(text)) == [65, 66, 67, 68, 69]
+        assert list(symbols(text, 1, 3)) == [66, 67]
+        assert list(symbols("абв", 2)) == ["в"]
+
+    def test_search_in_mapped_file(self, tmp_path):
+        """Тест: пошук у файлі, відображеному в пам'ять"""
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"INFO ok\n" * 1000 + b"ERROR disk full\n")
+        with map_file(path) as text:
+            assert search(text, b"ERROR") == 8000
+
+
+# ==================== RABIN-KARP NUMPY BACKEND TESTS ====================
+
+class TestRabinKarpBackend:
+    """Тести вибору бекенду Рабіна-Карпа"""
+
+    def test_unknown_backend(self):
+        """Тест: невідомий бекенд"""
+        with pytest.raises(ValueError):
+            rabin_karp("ABC", "B", backend="gpu")
+
+    def test_auto_without_numpy_falls_back(self, monkeypatch):
+        """Тест: auto без numpy використовує чистий Python"""
+        monkeypatch.setattr(substring_search, "np", None)
+        assert rabin_karp("ABCAABBCAABCBACBACA", "CBACA", backend="auto") == 14
+
+    def test_numpy_backend_requires_numpy(self, monkeypatch):
+        """Тест: бекенд numpy без numpy - ImportError"""
+        monkeypatch.setattr(substring_search, "np", None)
+        with pytest.raises(ImportError):
+            rabin_karp("ABC", "B", backend="numpy")
+
+
+class TestRabinKarpNumpy:
+    """Тести векторизованого Рабіна-Карпа"""
+
+    @pytest.fixture(autouse=True)
+    def require_numpy(self):
+        pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("text, pattern, expected", SINGLE_MATCH_CASES)
+    def test_first_occurrence(self, text, pattern, expected):
+        """Тест: перше входження як у чистому Python"""
+        assert rabin_karp(text, pattern, backend="numpy") == expected
+
+    @pytest.mark.parametrize("block", [1, 3, 16, 1 << 16])
+    def test_block_boundaries(self, block):
+        """Тест: входження на межі блоків"""
+        text = "xyABCxyABCABC" * 5
+        assert list(rabin_karp_numpy_finditer(text, "ABC", block=block)) == naive_find_all(text, "ABC")
+
+    def test_matches_python_backend(self):
+        """Тест: ті самі позиції, що й у чистого Python"""
+        import random
+        rnd = random.Random(8)
+        for _ in range(100):
+            alphabet = rnd.choice(["AB", "ABC", "аб\U0001F600"])
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 80)))
+            pattern = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 6)))
+            assert list(rabin_karp_finditer(text, pattern, backend="numpy")) == \
+                list(rabin_karp_finditer(text, pattern, backend="python"))
+
+    def test_bytes(self, as_buffer):
+        """Тест: буфери байтів без копіювання в str"""
+        data = "пошук у байтах, пошук".encode("utf-8")
+        pattern = "пошук".encode("utf-8")
+        found = list(rabin_karp_finditer(as_buffer(data), pattern, backend="numpy"))
+        assert found == naive_find_all(data, pattern)
+
+    def test_mapped_file_closes_after_partial_scan(self, tmp_path):
+        """Тест: після першого збігу файл можна закрити (масив не тримає буфер)"""
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"INFO ok\n" * 20000 + b"ERROR disk\n" + b"ERROR net\n")
+        text = map_file(path)
+        found = rabin_karp_numpy_finditer(text, b"ERROR", block=1 << 10)
+        assert next(found) == 160000
+        text.close()
+
+    def test_long_pattern(self):
+        """Тест: довгий паттерн (суми не переповнюються)"""
+        pattern = "абвгґдеєжз" * 500
+        text = "x" * 100 + pattern + "y" * 100
+        assert rabin_karp(text, pattern, backend="numpy") == 100
+
+
+# ==================== INSTRUMENTATION TESTS ====================
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+class TestSearchStatsEngines:
+    """Тести лічильників для кожного алгоритму з ENGINES"""
+
+    def test_same_results_with_stats(self, engine):
+        """Тест: з профайлером результати ті самі"""
+        text = "ABCAABBCAABCBACBACA" * 3
+        assert list(ENGINES[engine](text, "CBACA", stats=SearchStats())) == list(ENGINES[engine](text, "CBACA"))
+
+    def test_counters_filled(self, engine):
+        """Тест: лічильники і час заповнюються"""
+        stats = SearchStats()
+        list(ENGINES[engine]("The quick brown fox jumps over the lazy dog", "lazy", stats=stats))
+        assert stats.comparisons > 0
+        assert stats.shifts > 0
+        assert stats.preprocess_time > 0
+        assert stats.scan_time > 0
+
+    def test_stats_accumulate(self, engine):
+        """Тест: один об'єкт накопичує статистику кількох пошуків"""
+        stats = SearchStats()
+        list(ENGINES[engine]("ABABAB", "BA", stats=stats))
+        first = stats.comparisons
+        list(ENGINES[engine]("ABABAB", "BA", stats=stats))
+        assert stats.comparisons == 2 * first
+
+    def test_no_match_on_short_text(self, engine):
+        """Тест: текст коротший за паттерн - нуль порівнянь"""
+        stats = SearchStats()
+        assert list(ENGINES[engine]("AB", "ABC", stats=stats)) == []
+        assert stats.comparisons == 0
+
+
+class TestSearchStats:
+    """Тести профайлера пошуку"""
+
+    def test_initial_state(self):
+        """Тест: початкові значення нульові"""
+        stats = SearchStats()
+        assert (stats.comparisons, stats.shifts, stats.hash_hits, stats.false_positives) == (0, 0, 0, 0)
+        assert stats.preprocess_time == stats.scan_time == 0.0
+
+    def test_repr(self):
+        """Тест: зрозуміле текстове представлення"""
+        assert "comparisons=0" in repr(SearchStats())
+
+    def test_boyer_moore_counters_match_stats(self):
+        """Тест: лічильники boyer_moore збігаються з профайлером"""
+        text = "ABCAABBCAABCBACBACA"
+        pos, comparing, jumps = boyer_moore(text, "CBACA", use_good_suffix=True)
+        stats = SearchStats()
+        assert next(boyer_moore_finditer(text, "CBACA", use_good_suffix=True, stats=stats)) == pos
+        assert (stats.comparisons, stats.shifts) == (comparing, jumps)
+
+    def test_kmp_comparisons_linear(self):
+        """Тест: KMP робить не більше 2n порівнянь"""
+        text = "AAAAAAAAAAAAAAAAAAAB" * 10
+        stats = SearchStats()
+        list(kmp_finditer(text, "AAAB", stats=stats))
+        assert stats.comparisons <= 2 * len(text)
+
+    def test_rabin_karp_hash_hits(self):
+        """Тест: збіги хешу = входження + хибні спрацювання"""
+        text = "ABABABAB"
+        stats = SearchStats()
+        found = list(rabin_karp_finditer(text, "ABA", stats=stats))
+        assert stats.hash_hits == len(found) + stats.false_positives
+        assert stats.comparisons == len(text) - 3 + 1
+
+    def test_rabin_karp_numpy_stats(self):
+        """Тест: профайлер для бекенду numpy"""
+        pytest.importorskip("numpy")
+        stats = SearchStats()
+        found = list(rabin_karp_finditer("ABABABAB", "ABA", backend="numpy", stats=stats))
+        assert found == [0, 2, 4]
+        assert stats.hash_hits == 3 + stats.false_positives
+        assert stats.comparisons == 6
+
+    def test_search_passes_stats(self):
+        """Тест: диспетчер search передає профайлер алгоритму"""
+        stats = SearchStats()
+        assert search("hello world", "world", stats=stats) == 6
+        assert stats.comparisons > 0
+
+
+# ==================== DENSE BAD CHARACTER TABLE TESTS ====================
+
+class TestDenseBadCharTable:
+    """Тести щільної таблиці bad character"""
+
+    def test_latin_is_dense(self):
+        """Тест: латиниця - список за кодом символу"""
+        table = build_bad_char_table("ABCA")
+        assert isinstance(table, list) and len(table) == DENSE_LIMIT
+        assert table[ord("A")] == 3 and table[ord("C")] == 2 and table[ord("Z")] == -1
+
+    def test_cyrillic_is_dense(self):
+        """Тест: кирилиця вміщується в щільну таблицю"""
+        table = build_bad_char_table("пошук")
+        assert isinstance(table, list)
+        assert table[ord("к")] == 4
+
+    def test_sparse_unicode_is_dict(self):
+        """Тест: символи поза діапазоном - словник"""
+        assert build_bad_char_table("日本語") == {"日": 0, "本": 1, "語": 2}
+        assert isinstance(build_bad_char_table("ok \U0001F600"), dict)
+
+    def test_forced_choice(self):
+        """Тест: примусовий вибір представлення"""
+        assert isinstance(build_bad_char_table("ABC", dense=False), dict)
+        table = build_bad_char_table("日本", dense=True)
+        assert isinstance(table, list) and table[ord("本")] == 1
+
+    def test_text_symbols_outside_table(self):
+        """Тест: символи тексту поза таблицею не ламають пошук"""
+        text = "пошук \U0001F600 — “пошук” 日本 пошук"
+        for use_gs in (False, True):
+            matcher = BoyerMoore("пошук", use_good_suffix=use_gs)
+            assert isinstance(matcher.bad_char, list)
+            assert list(matcher.finditer(text)) == naive_find_all(text, "пошук")
+
+    def test_dense_and_dict_same_results(self):
+        """Тест: обидва представлення дають ті самі входження і лічильники"""
+        import random
+        rnd = random.Random(12)
+        for _ in range(100):
+            text = "".join(rnd.choice("абвгAB–") for _ in range(rnd.randint(0, 60)))
+            pattern = "".join(rnd.choice("абвгAB") for _ in range(rnd.randint(1, 5)))
+            dense, sparse = SearchStats(), SearchStats()
+            found = list(BoyerMoore(pattern, dense=True).finditer(text, dense))
+            assert found == list(BoyerMoore(pattern, dense=False).finditer(text, sparse))
+            assert found == naive_find_all(text, pattern)
+            assert dense.comparisons == sparse.comparisons
+
+
+# ==================== RABIN-KARP HASH MODE TESTS ====================
+
+@pytest.mark.parametrize("hash_mode", list(HASH_MODES))
+class TestRabinKarpHashModes:
+    """Тести режимів хешування Рабіна-Карпа"""
+
+    @pytest.mark.parametrize("text, pattern, expected", SINGLE_MATCH_CASES)
+    def test_first_occurrence(self, hash_mode, text, pattern, expected):
+        """Тест: перше входження у кожному режимі"""
+        assert rabin_karp(text, pattern, hash_mode=hash_mode) == expected
+
+    def test_find_all_random(self, hash_mode):
+        """Тест: всі входження на випадкових текстах"""
+        import random
+        rnd = random.Random(13)
+        for _ in range(100):
+            alphabet = rnd.choice(["AB", "абв", "аб\U0001F600"])
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 60)))
+            pattern = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 5)))
+            assert list(rabin_karp_finditer(text, pattern, hash_mode=hash_mode)) == naive_find_all(text, pattern)
+
+    def test_bytes(self, hash_mode, as_buffer):
+        """Тест: перевірка кандидатів без копій на всіх буферах"""
+        data = "пошук у байтах, пошук".encode("utf-8")
+        pattern = "пошук".encode("utf-8")
+        found = list(rabin_karp_finditer(as_buffer(data), pattern, hash_mode=hash_mode))
+        assert found == naive_find_all(data, pattern)
+
+    def test_stats(self, hash_mode):
+        """Тест: з профайлером результати ті самі"""
+        text = "алгоритм пошуку, алгоритми" * 3
+        stats = SearchStats()
+        found = list(rabin_karp_finditer(text, "алгоритм", stats=stats, hash_mode=hash_mode))
+        assert found == naive_find_all(text, "алгоритм")
+        assert stats.hash_hits == len(found) + stats.false_positives
+
+
+class TestRabinKarpCollisions:
+    """Тести хибних збігів хешу"""
+
+    def test_mod31_structural_collision(self):
+        """Тест: з основою 256 різні кириличні вікна мають однаковий хеш"""
+        # 1*256 + 300 == 2*256 + 44
+        stats = SearchStats()
+        assert rabin_karp("\x02,", "\x01Ĭ", stats=stats) is None
+        assert stats.hash_hits == 1
+        assert stats.false_positives == 1
+
+    @pytest.mark.parametrize("hash_mode", ["mersenne61", "double"])
+    def test_no_structural_collision(self, hash_mode):
+        """Тест: основа більша за будь-який код символу"""
+        stats = SearchStats()
+        assert rabin_karp("\x02,", "\x01Ĭ", stats=stats, hash_mode=hash_mode) is None
+        assert stats.hash_hits == 0
+        assert stats.false_positives == 0
+
+    def test_unknown_hash_mode(self):
+        """Тест: невідомий режим хешування"""
+        with pytest.raises(ValueError):
+            rabin_karp("ABC", "B", hash_mode="md5")
+
+    def test_numpy_only_mod31(self):
+        """Тест: бекенд numpy підтримує лише mod31"""
+        with pytest.raises(ValueError):
+            rabin_karp("ABC", "B", backend="numpy", hash_mode="double")
+
+    def test_auto_with_other_mode_uses_python(self):
+        """Тест: auto з іншим режимом обирає чистий Python"""
+        assert rabin_karp("ABCAABBCAABCBACBACA", "CBACA", backend="auto", hash_mode="mersenne61") == 14
+
+
+# ==================== KMP AUTOMATON TESTS ====================
+
+class TestKMPAutomaton:
+    """Тести KMP-автомата"""
+
+    def test_transitions(self):
+        """Тест: таблиця переходів для ABAB"""
+        dfa = build_kmp_dfa("ABAB")
+        assert dfa[0] == {"A": 1}
+        assert dfa[3] == {"A": 1, "B": 4}
+        # after a full match continue from the border "AB"
+        assert dfa[4] == {"A": 3}
+
+    def test_bytes_transitions(self):
+        """Тест: для байтів - плоска таблиця зі станами, помноженими на 256"""
+        dfa = build_kmp_dfa(b"AB")
+        assert len(dfa) == 3 * 256
+        assert dfa[ord("A")] == 256
+        assert dfa[256 + ord("B")] == 512
+        assert dfa[256 + ord("A")] == 256
+        assert dfa[256 + ord("C")] == 0
+
+    @pytest.mark.parametrize("mode", ["lps", "dfa", "auto"])
+    def test_modes_find_all(self, mode):
+        """Тест: усі режими дають ті самі входження"""
+        import random
+        rnd = random.Random(14)
+        for _ in range(100):
+            alphabet = rnd.choice(["AB", "ACGT", "аб\U0001F600"])
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 80)))
+            pattern = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 6)))
+            assert list(kmp_finditer(text, pattern, mode=mode)) == naive_find_all(text, pattern)
+
+    @pytest.mark.parametrize("mode", ["lps", "dfa"])
+    def test_bytes(self, mode, as_buffer):
+        """Тест: автомат на всіх буферах байтів"""
+        data = b"ACGTACGACGTACGTAC" * 3
+        found = list(kmp_finditer(as_buffer(data), b"ACGTAC", mode=mode))
+        assert found == naive_find_all(data, b"ACGTAC")
+
+    @pytest.mark.parametrize("mode", ["lps", "dfa"])
+    def test_stats(self, mode):
+        """Тест: лічильники в обох режимах"""
+        text = "ABABCABAB" * 5
+        stats = SearchStats()
+        assert list(kmp_finditer(text, "ABAB", stats=stats, mode=mode)) == naive_find_all(text, "ABAB")
+        assert stats.comparisons >= len(text)
+        assert stats.shifts > 0
+
+    def test_dfa_one_lookup_per_symbol(self):
+        """Тест: автомат робить рівно одну перевірку на символ"""
+        stats = SearchStats()
+        list(kmp_finditer("AAAAB" * 10, "AAAB", stats=stats, mode="dfa"))
+        assert stats.comparisons == 50
+
+    def test_auto_falls_back_to_lps(self, monkeypatch):
+        """Тест: завеликий автомат - повернення до LPS"""
+        monkeypatch.setattr(substring_search, "DFA_MAX_CELLS", 0)
+        monkeypatch.setattr(substring_search, "build_kmp_dfa", None)
+        assert kmp("ABCAABBCAABCBACBACA", "CBACA") == 14
+
+    def test_unknown_mode(self):
+        """Тест: невідомий режим"""
+        with pytest.raises(ValueError):
+            kmp("ABC", "B", mode="nfa")
+
+
+# ==================== TWO-WAY TESTS ====================
+
+class TestTwoWay:
+    """Тести алгоритму Two-Way (Крошмор-Перрен)"""
+
+    @pytest.mark.parametrize("text, pattern, expected", SINGLE_MATCH_CASES)
+    def test_first_occurrence(self, text, pattern, expected):
+        """Тест: перше входження"""
+        assert two_way(text, pattern) == expected
+
+    def test_random_find_all(self):
+        """Тест: всі входження на випадкових текстах"""
+        import random
+        rnd = random.Random(15)
+        for _ in range(500):
+            alphabet = rnd.choice(["A", "AB", "ABC", "аб\U0001F600"])
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 40)))
+            pattern = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 8)))
+            assert list(two_way_finditer(text, pattern)) == naive_find_all(text, pattern)
+
+    @pytest.mark.parametrize("pattern, expected", [
+        ("abaab", (1, 3, True)),  # ab|aab
+        ("aaaa", (-1, 1, True)),
+        ("abcd", (2, 4, False)),  # abc|d
+        ("ab", (0, 2, False)),
+    ])
+    def test_critical_factorization(self, pattern, expected):
+        """Тест: критична позиція, період і періодичність"""
+        assert critical_factorization(pattern) == expected
+
+    @pytest.mark.parametrize("text, pattern", [
+        ("A" * 10000, "A" * 50 + "B"),
+        ("AB" * 5000, "AB" * 25),
+        ("ABC" * 3000, "ABCABD"),
+    ])
+    def test_linear_worst_case(self, text, pattern):
+        """Тест: кількість порівнянь не більша за 2n"""
+        stats = SearchStats()
+        list(two_way_finditer(text, pattern, stats=stats))
+        assert stats.comparisons <= 2 * len(text)
+
+    def test_search_dispatch(self):
+        """Тест: доступний через ENGINES"""
+        assert list(ENGINES["two_way"]("abaabaab", "abaab")) == [0, 3]
+
+
+# ==================== PATTERN CACHE TESTS ====================
+
+class TestPatternCache:
+    """Тести LRU-кешу скомпільованих паттернів"""
+
+    def test_hits_and_misses(self):
+        """Тест: повторний паттерн береться з кешу"""
+        cache = PatternCache()
+        first = cache.get(build_LPS, "ABAB")
+        assert cache.get(build_LPS, "ABAB") is first
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert first == [0, 0, 1, 2]
+
+    def test_key_includes_builder_and_args(self):
+        """Тест: різні таблиці одного паттерна не плутаються"""
+        cache = PatternCache()
+        plain = cache.get(BoyerMoore, "ABAB", False)
+        with_gs = cache.get(BoyerMoore, "ABAB", True)
+        assert plain is not with_gs and with_gs.gs is not None
+        assert cache.get(build_LPS, "ABAB") == [0, 0, 1, 2]
+        assert len(cache) == 3
+
+    def test_lru_by_entries(self):
+        """Тест: витісняється найдавніше використаний"""
+        cache = PatternCache(max_entries=2)
+        cache.get(build_LPS, "A")
+        cache.get(build_LPS, "B")
+        cache.get(build_LPS, "A") # A is now most recent
+        cache.get(build_LPS, "C")
+        assert [key[1] for key in cache.entries] == ["A", "C"]
+        assert cache.evictions == 1
+
+    def test_lru_by_bytes(self):
+        """Тест: обмеження за оцінкою розміру таблиць"""
+        size = table_bytes(build_LPS("x" * 100))
+        cache = PatternCache(max_bytes=2 * size)
+        for sym in "abc":
+            cache.get(build_LPS, sym * 100)
+        assert len(cache) == 2
+        assert cache.bytes <= 2 * size
+
+    def test_too_big_not_cached(self):
+        """Тест: таблиця більша за ліміт не кешується"""
+        cache = PatternCache(max_bytes=100)
+        assert cache.get(build_LPS, "x" * 1000) == list(range(1000))
+        assert len(cache) == 0
+
+    def test_disable_and_resize(self):
+        """Тест: вимкнення і зміна розміру"""
+        cache = PatternCache()
+        for sym in "abcd":
+            cache.get(build_LPS, sym)
+        cache.resize(max_entries=2)
+        assert len(cache) == 2
+        cache.resize(max_entries=0)
+        assert not cache.enabled and len(cache) == 0
+        cache.get(build_LPS, "a")
+        assert len(cache) == 0 and cache.misses == 4
+
+    def test_clear(self):
+        """Тест: очищення скидає статистику"""
+        cache = PatternCache()
+        cache.get(build_LPS, "a")
+        cache.get(build_LPS, "a")
+        cache.clear()
+        assert (len(cache), cache.bytes, cache.hits, cache.misses) == (0, 0, 0, 0)
+
+    def test_table_bytes_grows_with_table(self):
+        """Тест: оцінка розміру росте з таблицею"""
+        assert table_bytes(BoyerMoore("x" * 1000, use_good_suffix=True)) > table_bytes(BoyerMoore("x", use_good_suffix=True))
+
+    @pytest.mark.parametrize("engine", list(ENGINES))
+    def test_engines_share_cache(self, engine, monkeypatch):
+        """Тест: усі алгоритми беруть таблиці з модульного кешу"""
+        cache = PatternCache()
+        monkeypatch.setattr(substring_search, "PATTERN_CACHE", cache)
+        text = "ABCAABBCAABCBACBACA" * 3
+        first = list(ENGINES[engine](text, "CBACA"))
+        assert list(ENGINES[engine](text, "CBACA")) == first == naive_find_all(text, "CBACA")
+        assert cache.hits >= 1
+
+    def test_bytes_like_patterns_share_entry(self, monkeypatch):
+        """Тест: bytearray і bytes-паттерн - один запис"""
+        cache = PatternCache()
+        monkeypatch.setattr(substring_search, "PATTERN_CACHE", cache)
+        assert kmp(b"xxABAB", bytearray(b"ABAB")) == kmp(b"xxABAB", b"ABAB") == 2
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+# ==================== CASEFOLD TESTS ====================
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+class TestCasefoldEngines:
+    """Тести пошуку без урахування регістру"""
+
+    def test_cyrillic(self, engine):
+        """Тест: кирилиця у різних регістрах"""
+        text = "Пошук ПІДРЯДКА, пошук Підрядка"
+        assert list(ENGINES[engine](text, "підрядка", casefold=True)) == [6, 22]
+        assert list(ENGINES[engine](text, "підрядка")) == []
+
+    def test_positions_in_original_text(self, engine):
+        """Тест: позиції не зсуваються, навіть коли casefold розширює символ"""
+        text = "Straße STRASSE straße"
+        assert list(ENGINES[engine](text, "STRAßE", casefold=True)) == [0, 15]
+        assert list(ENGINES[engine](text, "strasse", casefold=True)) == [7]
+
+    def test_final_sigma(self, engine):
+        """Тест: кінцева сигма згортається до σ"""
+        assert list(ENGINES[engine]("ΣΊΣΥΦΟΣ", "σίσυφος", casefold=True)) == [0]
+
+    def test_bytes(self, engine, as_buffer):
+        """Тест: для байтів згортаються лише A-Z"""
+        text = as_buffer(b"GET /Index.HTML get /index.html")
+        assert list(ENGINES[engine](text, b"get /INDEX.html", casefold=True)) == [0, 16]
+
+    def test_random_matches_lower(self, engine):
+        """Тест: збігається з пошуком у text.lower()"""
+        import random
+        rnd = random.Random(19)
+        for _ in range(50):
+            text = "".join(rnd.choice("aAбБ") for _ in range(rnd.randint(0, 40)))
+            pattern = "".join(rnd.choice("aAбБ") for _ in range(rnd.randint(1, 4)))
+            assert list(ENGINES[engine](text, pattern, casefold=True)) == naive_find_all(text.lower(), pattern.lower())
+
+    def test_stats(self, engine):
+        """Тест: профайлер разом з casefold"""
+        stats = SearchStats()
+        assert list(ENGINES[engine]("Hello HELLO", "hello", stats=stats, casefold=True)) == [0, 6]
+        assert stats.comparisons > 0
+
+    def test_type_mismatch(self, engine):
+        """Тест: str-паттерн у bytes-тексті"""
+        with pytest.raises(TypeError):
+            list(ENGINES[engine](b"abc", "A", casefold=True))
+
+
+class TestCasefold:
+    """Тести згортання регістру"""
+
+    def test_view_does_not_copy(self):
+        """Тест: вигляд тримає оригінальний текст"""
+        text = "ABC" * 10
+        view = FoldedText(text)
+        assert view.text is text
+        assert len(view) == 30
+        assert view[1] == "b" and view[3:6] == "abc"
+        assert "".join(view) == text.lower()
+
+    def test_fold_case_keeps_length(self):
+        """Тест: згортання один до одного"""
+        for s in ["Straße", "İstanbul", "ΣΊΣΥΦΟΣ", "ﬁle"]:
+            assert len(fold_case(s)) == len(s)
+        assert fold_case(bytearray(b"AbC\xc4")) == b"abc\xc4"
+
+    def test_search_dispatch(self):
+        """Тест: search() передає casefold"""
+        assert search("Hello World", "WORLD", casefold=True) == 6
+
+    def test_first_match_wrappers(self):
+        """Тест: функції першого входження"""
+        text = "xx ABC abc"
+        assert boyer_moore(text, "abc", casefold=True)[0] == 3
+        assert horspool(text, "abc", casefold=True) == 3
+        assert sunday(text, "abc", casefold=True) == 3
+        assert kmp(text, "abc", casefold=True) == 3
+        assert two_way(text, "abc", casefold=True) == 3
+        assert rabin_karp(text, "abc", casefold=True) == 3
+
+    def test_numpy_backend(self):
+        """Тест: numpy згортає блоки"""
+        pytest.importorskip("numpy")
+        assert rabin_karp("Пошук ПІДРЯДКА", "підрядка", backend="numpy", casefold=True) == 6
+
+
+# ==================== BITAP APPROXIMATE TESTS ====================
+
+def edit_distance(a, b):
+    prev = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        cur = [i]
+        for j, y in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j-1] + 1, prev[j-1] + (x != y)))
+        prev = cur
+    return prev[-1]
+
+
+def naive_approximate(text, pattern, k, metric):
+    # (end, smallest distance) for every end position within k
+    m = len(pattern)
+    found = []
+    for end in range(1, len(text) + 1):
+        if metric == "hamming":
+            if end < m:
+                continue
+            d = sum(a != b for a, b in zip(text[end-m:end], pattern))
+        else:
+            d = min(edit_distance(text[start:end], pattern) for start in range(end + 1))
+        if d <= k:
+            found.append((end, d))
+    return found
+
+
+class TestBitap:
+    """Тести наближеного пошуку (bitap)"""
+
+    def test_masks(self):
+        """Тест: бітові маски символів"""
+        assert build_bitap_masks("ABA") == {"A": 0b101, "B": 0b010}
+        assert build_bitap_masks(b"AB")[ord("B")] == 0b10
+
+    def test_exact(self):
+        """Тест: k=0 - точний пошук"""
+        text = "ABCAABBCAABCBACBACA"
+        assert [end - 5 for end, _ in bitap_finditer(text, "CBACA", k=0)] == naive_find_all(text, "CBACA")
+
+    def test_hamming(self):
+        """Тест: заміна символу"""
+        assert list(bitap_finditer("пошук пашук пошyк", "пошук", k=1, metric="hamming")) == [(5, 0), (11, 1), (17, 1)]
+
+    def test_levenshtein_typos(self):
+        """Тест: пропущений і зайвий символ"""
+        text = "алгоритм алгорим аллгоритм"
+        ends = {end: d for end, d in bitap_finditer(text, "алгоритм", k=1)}
+        assert ends[8] == 0 and ends[16] == 1 and ends[26] == 1
+
+    @pytest.mark.parametrize("metric", ["hamming", "levenshtein"])
+    def test_random(self, metric):
+        """Тест: збігається з наївною відстанню"""
+        import random
+        rnd = random.Random(20)
+        for _ in range(300):
+            alphabet = rnd.choice(["AB", "ABC", "абв"])
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 20)))
+            pattern = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 5)))
+            k = rnd.randrange(len(pattern))
+            assert list(bitap_finditer(text, pattern, k, metric)) == naive_approximate(text, pattern, k, metric)
+
+    def test_long_pattern(self):
+        """Тест: паттерн довший за 64 символи (великі цілі)"""
+        pattern = "абвгґдеєжзиіїйклмнопрстуфхцчшщьюя" * 3
+        noisy = pattern[:40] + "x" + pattern[41:70] + pattern[71:]
+        text = "..." + noisy + "..."
+        assert bitap(text, pattern, k=2) == (3 + len(noisy), 2)
+        assert bitap(text, pattern, k=1) is None
+
+    def test_bytes(self, as_buffer):
+        """Тест: буфери байтів"""
+        text = as_buffer(b"GET /index.htnl")
+        assert list(bitap_finditer(text, b"index.html", k=1, metric="hamming")) == [(15, 1)]
+
+    def test_casefold(self):
+        """Тест: без урахування регістру"""
+        assert bitap("ПОШУК", "пошук", k=0, casefold=True) == (5, 0)
+
+    def test_invalid_arguments(self):
+        """Тест: некоректні параметри"""
+        with pytest.raises(ValueError):
+            bitap("abc", "ab", k=2)
+        with pytest.raises(ValueError):
+            bitap("abc", "", k=0)
+        with pytest.raises(ValueError):
+            bitap("abc", "ab", metric="jaro")
+        with pytest.raises(TypeError):
+            bitap(b"abc", "ab")
+
+
+# ==================== SHIFT-OR TESTS ====================
+
+class TestShiftOr:
+    """Тести точного бітово-паралельного пошуку"""
+
+    @pytest.mark.parametrize("text, pattern, expected", SINGLE_MATCH_CASES)
+    def test_first_occurrence(self, text, pattern, expected):
+        """Тест: перше входження"""
+        assert shift_or(text, pattern) == expected
+
+    def test_random_find_all(self):
+        """Тест: всі входження на випадкових текстах"""
+        import random
+        rnd = random.Random(21)
+        for _ in range(300):
+            alphabet = rnd.choice(["A", "AB", "ACGT", "аб\U0001F600"])
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 60)))
+            pattern = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 6)))
+            assert list(shift_or_finditer(text, pattern)) == naive_find_all(text, pattern)
+
+    def test_long_pattern(self):
+        """Тест: паттерн довший за 64 символи"""
+        pattern = "ab" * 50 + "c"
+        text = "ab" * 200 + "c" + pattern
+        assert list(shift_or_finditer(text, pattern)) == naive_find_all(text, pattern)
+
+    def test_one_step_per_symbol(self):
+        """Тест: рівно один крок на символ тексту"""
+        stats = SearchStats()
+        list(shift_or_finditer("ACGT" * 25, "GTAC", stats=stats))
+        assert stats.comparisons == stats.shifts == 100
+
+
+# ==================== COUNT / CONTAINS TESTS ====================
+
+@pytest.mark.parametrize("engine", list(ENGINES) + [None])
+class TestCountContains:
+    """Тести підрахунку і перевірки наявності"""
+
+    @pytest.mark.parametrize("text, pattern, overlapping, expected", [
+        ("AAAAA", "AA", True, 4),
+        ("AAAAA", "AA", False, 2),
+        ("abababa", "aba", True, 3),
+        ("abababa", "aba", False, 2),
+        ("hello world", "xyz", True, 0),
+        ("ab", "abc", False, 0),
+        ("abc", "", True, 4),
+        ("abc", "", False, 4),
+    ])
+    def test_count(self, engine, text, pattern, overlapping, expected):
+        """Тест: з перекриттям і без"""
+        assert count(text, pattern, engine, overlapping) == expected
+
+    def test_non_overlapping_like_str_count(self, engine):
+        """Тест: без перекриття збігається з str.count"""
+        import random
+        rnd = random.Random(22)
+        for _ in range(50):
+            text = "".join(rnd.choice("AB") for _ in range(rnd.randint(0, 40)))
+            pattern = "".join(rnd.choice("AB") for _ in range(rnd.randint(1, 4)))
+            assert count(text, pattern, engine, overlapping=False) == text.count(pattern)
+            assert count(text, pattern, engine) == len(naive_find_all(text, pattern))
+
+    def test_contains(self, engine):
+        """Тест: наявність входження"""
+        assert contains("The quick brown fox", "brown", engine)
+        assert not contains("The quick brown fox", "Brown", engine)
+        assert contains("The quick brown fox", "BROWN", engine, casefold=True)
+
+    def test_bytes(self, engine, as_buffer):
+        """Тест: буфери байтів"""
+        text = as_buffer(b"ERROR ok ERRORERROR")
+        assert count(text, b"ERROR", engine) == 3
+        assert contains(text, b"ok", engine)
+
+
+class TestCountContainsEngine:
+    """Тести вибору алгоритму для count/contains"""
+
+    def test_unknown_engine(self):
+        """Тест: невідомий алгоритм"""
+        with pytest.raises(ValueError):
+            count("abc", "b", engine="grep")
+        with pytest.raises(ValueError):
+            contains("abc", "b", engine="grep")
+
+    def test_contains_stops_at_first_match(self, monkeypatch):
+        """Тест: contains не сканує далі першого входження"""
+        seen = []
+
+        def finditer(text, pattern, casefold=False):
+            for pos in (1, 2, 3):
+                seen.append(pos)
+                yield pos
+
+        monkeypatch.setitem(ENGINES, "probe", finditer)
+        assert contains("abcd", "b", engine="probe")
+        assert seen == [1]
+
+    @pytest.mark.parametrize("engine", [None, *ENGINES])
+    def test_engine_finditer(self, engine):
+        """Тест: engine_finditer повертає ітератор входжень"""
+        found = engine_finditer("abcABCabc", "abc", engine, casefold=True)
+        assert list(found) == [0, 3, 6]
+
+
+# ==================== START / END TESTS ====================
+
+class TailProbe:
+    # str-like text that remembers the smallest index read
+    def __init__(self, text):
+        self.text = text
+        self.lowest = len(text)
+
+    def __len__(self):
+        return len(self.text)
+
+    def __getitem__(self, i):
+        self.lowest = min(self.lowest, i.start if isinstance(i, slice) else i)
+        return self.text[i]
+
+
+BOUNDED_ENGINES = [
+    pytest.param(lambda t, p, **kw: boyer_moore_finditer(t, p, **kw), id="boyer_moore"),
+    pytest.param(lambda t, p, **kw: boyer_moore_finditer(t, p, use_good_suffix=True, **kw), id="boyer_moore_gs"),
+    pytest.param(lambda t, p, **kw: kmp_finditer(t, p, mode="lps", **kw), id="kmp_lps"),
+    pytest.param(lambda t, p, **kw: kmp_finditer(t, p, mode="dfa", **kw), id="kmp_dfa"),
+    pytest.param(rabin_karp_finditer, id="rabin_karp"),
+    pytest.param(lambda t, p, **kw: rabin_karp_finditer(t, p, hash_mode="double", **kw), id="rabin_karp_double"),
+]
+
+
+def naive_region(text, pattern, start, end):
+    first, last = bounds(len(text), start, end)
+    if not pattern:
+        return list(range(first, last + 1))
+    return [i for i in range(first, last - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+@pytest.mark.parametrize("finditer", BOUNDED_ENGINES)
+class TestBoundedSearch:
+    """Тести пошуку в межах text[start:end] без копіювання"""
+
+    def test_absolute_positions(self, finditer):
+        """Тест: позиції відносно всього тексту"""
+        text = "abc abc abc abc"
+        assert list(finditer(text, "abc", start=1, end=12)) == [4, 8]
+
+    def test_match_must_fit_region(self, finditer):
+        """Тест: входження, що виходить за end, не рахується"""
+        assert list(finditer("abcabc", "abc", end=5)) == [0]
+        assert list(finditer("abcabc", "abc", start=1)) == [3]
+
+    def test_negative_bounds(self, finditer):
+        """Тест: від'ємні межі як у str.find"""
+        text = "abc abc abc"
+        assert list(finditer(text, "abc", start=-7)) == [4, 8]
+        assert list(finditer(text, "abc", start=-100, end=-4)) == [0, 4]
+
+    def test_stats(self, finditer):
+        """Тест: з профайлером"""
+        assert list(finditer("xxABABxx", "AB", stats=SearchStats(), start=3)) == [4]
+
+    @pytest.mark.parametrize("casefold", [False, True])
+    def test_prefix_not_read(self, finditer, casefold):
+        """Тест: текст перед start не читається (і не згортається)"""
+        text = "x" * 100000 + "zz"
+        probe = TailProbe(text)
+        assert list(finditer(probe, "zz", start=len(text) - 50, casefold=casefold)) == [100000]
+        assert probe.lowest >= len(text) - 50
+
+    def test_random_like_str_find(self, finditer):
+        """Тест: перше входження як у str.find(sub, start, end)"""
+        import random
+        rnd = random.Random(23)
+        for _ in range(200):
+            text = "".join(rnd.choice("AB") for _ in range(rnd.randint(0, 30)))
+            pattern = "".join(rnd.choice("AB") for _ in range(rnd.randint(0, 4)))
+            start, end = rnd.randint(-35, 35), rnd.randint(-35, 35)
+            found = list(finditer(text, pattern, start=start, end=end))
+            assert found == naive_region(text, pattern, start, end)
+            assert (found[0] if found else -1) == text.find(pattern, start, end)
+
+    def test_bytes(self, finditer, as_buffer):
+        """Тест: межі в буферах байтів"""
+        text = as_buffer(b"GET /a GET /b GET /c")
+        assert list(finditer(text, b"GET", start=1, end=17)) == [7, 14]
+
+
+class TestBoundedWrappers:
+    """Тести start/end у функціях першого входження"""
+
+    def test_first_match(self):
+        """Тест: boyer_moore, kmp, rabin_karp"""
+        text = "needle hay needle hay"
+        assert boyer_moore(text, "needle", start=1)[0] == 11
+        assert kmp(text, "needle", start=1) == 11
+        assert rabin_karp(text, "needle", start=1) == 11
+        assert kmp(text, "needle", start=1, end=16) is None
+
+    def test_empty_pattern(self):
+        """Тест: порожній паттерн як у str.find"""
+        assert kmp("abc", "", start=2) == 2
+        assert kmp("abc", "", start=4) is None
+        assert rabin_karp("abc", "", start=2, end=1) is None
+
+    def test_numpy_backend(self):
+        """Тест: межі в numpy-бекенді"""
+        pytest.importorskip("numpy")
+        text = "abc " * 100
+        assert list(rabin_karp_finditer(text, "abc", backend="numpy", start=5, end=20)) == [8, 12, 16]
+
+
+# ==================== REVERSE SEARCH TESTS ====================
+
+RFIND_ENGINES = [
+    pytest.param(lambda t, p, **kw: boyer_moore_rfinditer(t, p, **kw), id="boyer_moore"),
+    pytest.param(lambda t, p, **kw: boyer_moore_rfinditer(t, p, use_good_suffix=True, **kw), id="boyer_moore_gs"),
+    pytest.param(kmp_rfinditer, id="kmp"),
+]
+
+
+@pytest.mark.parametrize("rfinditer", RFIND_ENGINES)
+class TestReverseSearch:
+    """Тести пошуку з кінця тексту"""
+
+    def test_right_to_left(self, rfinditer):
+        """Тест: входження від останнього до першого"""
+        text = "ABCAABBCAABCBACBACA" * 3
+        assert list(rfinditer(text, "CBACA")) == naive_find_all(text, "CBACA")[::-1]
+
+    def test_overlapping(self, rfinditer):
+        """Тест: входження, що перекриваються"""
+        assert list(rfinditer("AAAAA", "AA")) == [3, 2, 1, 0]
+        assert list(rfinditer("abababa", "aba")) == [4, 2, 0]
+
+    def test_random_like_str_rfind(self, rfinditer):
+        """Тест: перше знайдене - як str.rfind(sub, start, end)"""
+        import random
+        rnd = random.Random(24)
+        for _ in range(200):
+            alphabet = rnd.choice(["AB", "ABC", "аб\U0001F600"])
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 30)))
+            pattern = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 4)))
+            start, end = rnd.randint(-35, 35), rnd.randint(-35, 35)
+            found = list(rfinditer(text, pattern, start=start, end=end))
+            assert found == naive_region(text, pattern, start, end)[::-1]
+            assert (found[0] if found else -1) == text.rfind(pattern, start, end)
+
+    def test_touches_only_tail(self, rfinditer):
+        """Тест: останній запис у лозі знаходиться без читання початку"""
+        log = "INFO ok\n" * 10000 + "ERROR disk\n" + "INFO ok\n" * 10
+        probe = TailProbe(log)
+        assert next(rfinditer(probe, "ERROR")) == 80000
+        assert probe.lowest >= 80000 - len("ERROR")
+
+    def test_bytes(self, rfinditer, as_buffer):
+        """Тест: буфери байтів"""
+        text = as_buffer(b"GET /a GET /b GET /c")
+        assert list(rfinditer(text, b"GET")) == [14, 7, 0]
+
+    def test_casefold(self, rfinditer):
+        """Тест: без урахування регістру"""
+        assert list(rfinditer("Error ERROR error", "error", casefold=True)) == [12, 6, 0]
+
+
+class TestRfind:
+    """Тести функцій останнього входження"""
+
+    def test_last_occurrence(self):
+        """Тест: як str.rfind, але None замість -1"""
+        text = "needle hay needle hay"
+        assert boyer_moore_rfind(text, "needle") == 11
+        assert kmp_rfind(text, "needle") == 11
+        assert kmp_rfind(text, "needle", end=16) == 0
+        assert boyer_moore_rfind(text, "pin") is None
+
+    def test_empty_pattern(self):
+        """Тест: порожній паттерн"""
+        assert kmp_rfind("abc", "") == 3
+        assert boyer_moore_rfind("abc", "", end=1) == 1
+
+
+# ==================== WILDCARD TESTS ====================
+
+def naive_wildcard(text, pattern, wildcard="?"):
+    m = len(pattern)
+    return [i for i in range(len(text) - m + 1)
+            if all(p == wildcard or text[i+j] == p for j, p in enumerate(pattern))]
+
+
+@pytest.mark.parametrize("engine", list(WILDCARD_ENGINES))
+class TestWildcardEngines:
+    """Тести пошуку паттернів з символом '?'"""
+
+    def test_any_symbol(self, engine):
+        """Тест: '?' збігається з будь-яким символом"""
+        text = "ID-12-2024, ID-7b-2024, ID-1-2024, ID-99-2023"
+        assert list(wildcard_finditer(text, "ID-??-2024", engine=engine)) == [0, 12]
+
+    def test_random(self, engine):
+        """Тест: збігається з наївним пошуком"""
+        import random
+        rnd = random.Random(25)
+        for _ in range(300):
+            alphabet = rnd.choice(["AB", "ABC", "аб\U0001F600"])
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 40)))
+            pattern = "".join(rnd.choice(alphabet + "??") for _ in range(rnd.randint(1, 6)))
+            assert list(wildcard_finditer(text, pattern, engine=engine)) == naive_wildcard(text, pattern)
+
+    def test_only_wildcards(self, engine):
+        """Тест: паттерн лише з '?' збігається в кожній позиції"""
+        assert list(wildcard_finditer("abcde", "???", engine=engine)) == [0, 1, 2]
+        assert list(wildcard_finditer("ab", "???", engine=engine)) == []
+
+    def test_no_wildcards(self, engine):
+        """Тест: без '?' - звичайний точний пошук"""
+        text = "ABCAABBCAABCBACBACA"
+        assert list(wildcard_finditer(text, "CBACA", engine=engine)) == naive_find_all(text, "CBACA")
+
+    def test_empty_pattern(self, engine):
+        """Тест: порожній паттерн як у str.find"""
+        assert list(wildcard_finditer("abc", "", engine=engine)) == [0, 1, 2, 3]
+
+    def test_custom_wildcard(self, engine):
+        """Тест: інший символ-шаблон, '?' стає звичайним символом"""
+        text = "why? who? what"
+        assert list(wildcard_finditer(text, "wh*?", "*", engine=engine)) == [0, 5]
+
+    def test_bytes(self, engine, as_buffer):
+        """Тест: буфери байтів, шаблон як str або bytes"""
+        text = as_buffer(b"GET /a1 PUT /b2 GET /c3")
+        assert list(wildcard_finditer(text, b"GET /??", engine=engine)) == [0, 16]
+        assert list(wildcard_finditer(text, b"?ET", b"?", engine=engine)) == [0, 16]
+
+    def test_casefold(self, engine):
+        """Тест: без урахування регістру"""
+        assert list(wildcard_finditer("Id-1A-2024 ID-2b-2024", "id-??-2024", engine=engine, casefold=True)) == [0, 11]
+
+
+class TestWildcardSearch:
+    """Тести вибору рушія для паттернів з '?'"""
+
+    def test_first_match(self):
+        """Тест: перше входження або None"""
+        assert wildcard_search("order ID-42-2024", "ID-??-2024") == 6
+        assert wildcard_search("order ID-42-2023", "ID-??-2024") is None
+
+    def test_choose_engine(self):
+        """Тест: boyer-moore лише для довгого хвоста без '?' у природному тексті"""
+        text = "звичайний текст природною мовою " * 10
+        assert choose_wildcard_engine(text, "ID-??-2024") == "shift_or"
+        assert choose_wildcard_engine(text, "ID-?-invoice??") == "boyer_moore"
+        assert choose_wildcard_engine("ACGT" * 100, "A?CGTACGTACGT") == "shift_or"
+
+    def test_repetitive_text_not_quadratic(self):
+        """Тест: boyer-moore на повторюваному тексті переходить на shift-and"""
+        import time
+        text = "bcdef" + "a" * 200000
+        pattern = "b" + "a" * 800 + "?"
+        assert choose_wildcard_engine(text, pattern) == "boyer_moore"
+        started = time.perf_counter()
+        assert wildcard_search(text, pattern) is None
+        assert list(wildcard_finditer(text[4:], "f" + "a" * 50 + "?", engine="boyer_moore")) == [0]
+        # bad char rule alone needs ~23 s here
+        assert time.perf_counter() - started < 2
+
+    def test_fallback_keeps_matches(self, monkeypatch):
+        """Тест: після переходу на shift-and входження не губляться і не дублюються"""
+        import random
+        monkeypatch.setattr(substring_search, "WILDCARD_MAX_WORK", 0)
+        rnd = random.Random(251)
+        for _ in range(200):
+            text = "".join(rnd.choice("AB") for _ in range(rnd.randint(0, 40)))
+            pattern = "".join(rnd.choice("AB??") for _ in range(rnd.randint(1, 6)))
+            found = list(wildcard_finditer(text, pattern, engine="boyer_moore"))
+            assert found == naive_wildcard(text, pattern)
+
+    def test_invalid(self):
+        """Тест: невідомий рушій і шаблон з кількох символів"""
+        with pytest.raises(ValueError):
+            wildcard_search("abc", "a?c", engine="regex")
+        with pytest.raises(ValueError):
+            wildcard_search("abc", "a?c", wildcard="??")
@@ -0,0 +1,223 @@
+import pytest
+import sys
+from array import array
+from pathlib import Path
+
+# Додаємо src до шляху для імпорту
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from text_index import SuffixArray, build_suffix_array, build_lcp, SuffixAutomaton, build_min_tree, range_min
+
+
+def naive_find_all(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+def naive_lcp(a, b):
+    h = 0
+    while h < min(len(a), len(b)) and a[h] == b[h]:
+        h += 1
+    return h
+
+
+class TestSuffixArrayBuild:
+    """Тести побудови суфіксного масиву і LCP"""
+
+    def test_banana(self):
+        """Тест: класичний приклад"""
+        sa = build_suffix_array("banana")
+        assert sa == [5, 3, 1, 0, 4, 2]
+        assert build_lcp("banana", sa) == [0, 1, 3, 0, 0, 2]
+
+    def test_empty(self):
+        """Тест: порожній текст"""
+        assert build_suffix_array("") == []
+        assert build_lcp("", []) == []
+
+    @pytest.mark.parametrize("text", ["a" * 50, "ab" * 30, "абвабвг" * 7, "mississippi"])
+    def test_matches_sorted_suffixes(self, text):
+        """Тест: збігається з наївним сортуванням суфіксів"""
+        sa = build_suffix_array(text)
+        assert sa == sorted(range(len(text)), key=lambda i: text[i:])
+        lcp = build_lcp(text, sa)
+        assert lcp[1:] == [naive_lcp(text[sa[t-1]:], text[sa[t]:]) for t in range(1, len(text))]
+
+    def test_bytes(self):
+        """Тест: суфіксний масив байтів"""
+        data = "пошук".encode("utf-8") * 3
+        assert build_suffix_array(data) == sorted(range(len(data)), key=lambda i: data[i:])
+
+
+class TestRangeMin:
+    """Тести дерева мінімумів для find"""
+
+    def test_random_ranges(self):
+        """Тест: мінімум будь-якого відрізка як у min()"""
+        import random
+        rnd = random.Random(161)
+        for n in (1, 2, 3, 7, 16, 33):
+            values = [rnd.randrange(1000) for _ in range(n)]
+            tree = build_min_tree(values)
+            for lo in range(n):
+                for hi in range(lo + 1, n + 1):
+                    assert range_min(tree, lo, hi) == min(values[lo:hi])
+
+
+class TestSuffixArrayQueries:
+    """Тести запитів до суфіксного масиву"""
+
+    def test_find_all_and_count(self):
+        """Тест: всі входження і їх кількість"""
+        index = SuffixArray("ABCAABBCAABCBACBACA" * 5)
+        expected = naive_find_all("ABCAABBCAABCBACBACA" * 5, "CBACA")
+        assert index.find_all("CBACA") == expected
+        assert index.count("CBACA") == len(expected)
+        assert index.find("CBACA") == 14
+
+    def test_missing(self):
+        """Тест: паттерн відсутній"""
+        index = SuffixArray("hello world")
+        assert index.find("xyz") is None
+        assert index.find_all("xyz") == []
+        assert index.count("xyz") == 0
+
+    def test_pattern_longer_than_text(self):
+        """Тест: паттерн довший за текст"""
+        index = SuffixArray("ab")
+        assert index.find("abc") is None
+        assert index.count("abc") == 0
+
+    def test_overlapping(self):
+        """Тест: входження, що перекриваються"""
+        index = SuffixArray("AAAAA")
+        assert index.find_all("AA") == [0, 1, 2, 3]
+        assert index.count("AA") == 4
+
+    def test_find_frequent_pattern(self):
+        """Тест: find для частого фрагмента - найлівіше з тисяч входжень"""
+        import random
+        rnd = random.Random(162)
+        text = " ".join(rnd.choice(["і", "в", "пошук", "алгоритм"]) for _ in range(5000))
+        index = SuffixArray(text)
+        for pattern in ["і", "в ", " пошук"]:
+            assert index.count(pattern) > 500
+            assert index.find(pattern) == text.find(pattern)
+
+    def test_empty_pattern(self):
+        """Тест: порожній паттерн як у str.find"""
+        index = SuffixArray("abc")
+        assert index.find("") == 0
+        assert index.count("") == 4
+        assert index.find_all("") == [0, 1, 2, 3]
+
+    def test_random(self):
+        """Тест: збігається з наївним пошуком"""
+        import random
+        rnd = random.Random(16)
+        for _ in range(200):
+            alphabet = rnd.choice(["A", "AB", "ABC", "аб\U0001F600"])
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 50)))
+            index = SuffixArray(text)
+            for _ in range(5):
+                pattern = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 5)))
+                expected = naive_find_all(text, pattern)
+                assert index.find_all(pattern) == expected
+                assert index.count(pattern) == len(expected)
+                assert index.find(pattern) == (expected[0] if expected else None)
+
+    @pytest.mark.parametrize("convert", [bytes, bytearray, memoryview])
+    def test_bytes_like(self, convert):
+        """Тест: індекс над буфером байтів"""
+        data = "пошук у байтах, пошук".encode("utf-8")
+        index = SuffixArray(convert(data))
+        pattern = "пошук".encode("utf-8")
+        assert index.find_all(pattern) == naive_find_all(data, pattern)
+        assert index.find(bytearray(pattern)) == 0
+
+    def test_type_mismatch(self):
+        """Тест: str-паттерн у bytes-індексі"""
+        with pytest.raises(TypeError):
+            SuffixArray(b"abc").find("a")
+
+
+class TestSuffixAutomaton:
+    """Тести суфіксного автомата"""
+
+    def test_queries(self):
+        """Тест: наявність, кількість і перше входження"""
+        text = "ABCAABBCAABCBACBACA" * 5
+        automaton = SuffixAutomaton(text)
+        assert automaton.contains("CBACA")
+        assert automaton.count("CBACA") == len(naive_find_all(text, "CBACA"))
+        assert automaton.find("CBACA") == 14
+
+    def test_missing(self):
+        """Тест: паттерн відсутній"""
+        automaton = SuffixAutomaton("hello world")
+        assert not automaton.contains("xyz")
+        assert automaton.count("xyz") == 0
+        assert automaton.find("xyz") is None
+
+    def test_state_count_linear(self):
+        """Тест: не більше 2n-1 станів"""
+        for text in ["abbb", "ab" * 50, "абвгґд" * 10]:
+            assert len(SuffixAutomaton(text)) <= 2 * len(text) - 1
+
+    def test_array_layout(self):
+        """Тест: стани і переходи зберігаються в масивах int"""
+        automaton = SuffixAutomaton("абракадабра")
+        for table in (automaton.start, automaton.codes, automaton.targets, automaton.length, automaton.link):
+            assert isinstance(table, array) and table.typecode == "i"
+        assert len(automaton.start) == len(automaton) + 1
+        assert automaton.start[-1] == len(automaton.codes)
+
+    def test_empty_pattern(self):
+        """Тест: порожній паттерн як у str.find"""
+        automaton = SuffixAutomaton("abc")
+        assert automaton.contains("")
+        assert automaton.count("") == 4
+        assert automaton.find("") == 0
+
+    def test_empty_text(self):
+        """Тест: порожній текст"""
+        automaton = SuffixAutomaton("")
+        assert not automaton.contains("a")
+        assert automaton.count("") == 1
+
+    def test_random(self):
+        """Тест: збігається з наївним пошуком"""
+        import random
+        rnd = random.Random(17)
+        for _ in range(200):
+            alphabet = rnd.choice(["A", "AB", "ABC", "аб\U0001F600"])
+            text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 50)))
+            automaton = SuffixAutomaton(text)
+            for _ in range(5):
+                pattern = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 6)))
+                expected = naive_find_all(text, pattern)
+                assert automaton.contains(pattern) == bool(expected)
+                assert automaton.count(pattern) == len(expected)
+                assert automaton.find(pattern) == (expected[0] if expected else None)
+
+    @pytest.mark.parametrize("convert", [bytes, bytearray, memoryview])
+    def test_bytes_like(self, convert):
+        """Тест: автомат над буфером байтів"""
+        data = "пошук у байтах, пошук".encode("utf-8")
+        automaton = SuffixAutomaton(convert(data))
+        pattern = "пошук".encode("utf-8")
+        assert automaton.count(pattern) == 2
+        assert automaton.find(memoryview(pattern)) == 0
+
+    def test_type_mismatch(self):
+        """Тест: str-паттерн у bytes-автоматі"""
+        with pytest.raises(TypeError):
+            SuffixAutomaton(b"abc").contains("a")
+
+    def test_article(self):
+        """Тест: автомат над реальною статтею (cp1251)"""
+        text = (Path(__file__).parent.parent / "data" / "стаття 1.txt").read_bytes().decode("cp1251")
+        automaton = SuffixAutomaton(text)
+        for pattern in ["алгоритм", "пошук", text[1000:1030]]:
+            expected = naive_find_all(text, pattern)
+            assert automaton.count(pattern) == len(expected)
+            assert automaton.find(pattern) == expected[0]